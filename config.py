@@ -12,6 +12,27 @@ WINDOW_HEIGHT = 768
 MIN_NUMBER = 1
 MAX_NUMBER = 75
 
+# Board
+# Ranges with more numbers than RAFFLE_THRESHOLD switch to raffle mode:
+# the grid shows at most GRID_MAX_CELLS cells, each an aggregated block of
+# numbers (up to ~100k tickets), and the fairness bias is off.
+GRID_COLUMNS = 10
+RAFFLE_THRESHOLD = 100
+GRID_MAX_CELLS = 80
+GRID_BACKEND = "widgets" # "widgets" (CTkFrame per cell) or "canvas" (single tkinter.Canvas)
+
+# Settings
+VOLUME_SAVE_DELAY_MS = 500 # Persist volume once the slider is idle this long
+EFFECT_QUALITY_DEFAULT = "high" # "ultra", "high", "low" or "off" (used until a tier is saved)
+EFFECT_QUALITY_AUTO = True # Adjust the tier from measured frame times
+EXPLOSION_RENDERER = "canvas" # "canvas" (items per particle) or "pillow" (frames composited off-thread)
+
+# Audio
+# Mixer channels per sound effect (ticks last <= 200ms at >= 30ms spacing)
+SE_CHANNELS = {"move": 6, "decide": 2}
+SE_STEAL = ("move",) # Classes that cut their oldest voice instead of dropping
+SE_SHARED_CHANNELS = 2 # Unreserved channels for sounds not listed in SE_CHANNELS
+
 # Paths
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
@@ -20,6 +41,9 @@ SOUND_DIR = os.path.join(ASSETS_DIR, "sound")
 
 DATA_FILE = os.path.join(DATA_DIR, "bingo_data.json")
 BACKUP_FILE = os.path.join(DATA_DIR, "bingo_data_bak.json")
+BACKUP_GENERATIONS = 1 # Snapshot copies kept: bingo_data_bak.json = latest, bingo_data_bak.2.json = previous, ...
+JOURNAL_FILE = os.path.join(DATA_DIR, "bingo_data.journal")
+JOURNAL_COMPACT_EVERY = 100 # Records before the journal is folded into a new snapshot
 
 # Colors (Dark/Light)
 COLORS = {
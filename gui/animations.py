@@ -1,10 +1,14 @@
 import math
+from gui.spin_profile import get_spin_profile, warm_spin_profiles, P1_FRAMES_RANGE, CREEP_STEPS_RANGE
 
 class SpinAnimation:
-    def __init__(self, root, game_logic, audio_manager, 
+    FRAME_TIME = 0.016 # Seconds per velocity-profile frame (profile was designed for 16ms ticks)
+
+    def __init__(self, root, clock, game_logic, audio_manager, 
                  on_update_display, on_step_finish, on_complete):
         """
         :param root: Tkinter root (for .after)
+        :param clock: FrameClock driving the frames
         :param game_logic: Instance of GameLogic
         :param audio_manager: Instance of AudioManager
         :param on_update_display: Callback(number) to update UI
@@ -12,6 +16,7 @@ class SpinAnimation:
         :param on_complete: Callback(number) when animation finishes
         """
         self.root = root
+        self.clock = clock
         self.logic = game_logic
         self.audio = audio_manager
         
@@ -20,58 +25,25 @@ class SpinAnimation:
         self.on_complete = on_complete
         
         self.is_running = False
-        self._cancel_id = None
+        self._clock_handle = None
+        
+        # All profile variants are small; build them up front
+        warm_spin_profiles()
 
     def start(self, target_number):
         if self.is_running: return
         self.is_running = True
         
-        # === VELOCITY PROFILE GENERATION ===
-        self.velocity_profile = []
-        
-        # 1. P1: Speedster (Constant)
-        # Random duration: 1.0s - 2.0s (approx 60 - 125 frames at 16ms)
+        # === VELOCITY PROFILE (cached per variant) ===
+        # P1 duration: 1.0s - 2.0s, creep covers 2-4 numbers
         import random
-        p1_frames = random.randint(60, 125)
-        p1_v = 2.0
-        p1_profile = [p1_v] * p1_frames
-        self.velocity_profile.extend(p1_profile)
-        
-        # 2. P2: Main Deceleration
-        # V goes from 2.0 -> 0.05 (Very slow)
-        p2_frames = 100
-        p2_start_v = 2.0
-        p2_end_v = 0.05 
-        for i in range(p2_frames):
-            t = i / p2_frames
-            # Quadratic Decay for smooth feel
-            v = (p2_start_v - p2_end_v) * ((1.0 - t)**2) + p2_end_v
-            self.velocity_profile.append(v)
-        
-        # 3. P3: Creep / Tail (Randomized Length)
-        # V goes from 0.05 -> 0.0
-        # Calculate Duration T to cover 'creep_steps' starting from p2_end_v down to 0.
-        
-        import random
-        creep_steps = random.randint(2, 4)
-        
-        # Linear decay: Avg V = p2_end_v / 2.
-        # T = Steps / AvgV = 2 * Steps / p2_end_v.
-        
-        p3_start_v = p2_end_v
-        p3_frames = int(2.0 * creep_steps / p3_start_v)
-        
-        for i in range(p3_frames):
-             t = i / p3_frames
-             # Linear decay to 0
-             v = p3_start_v * (1.0 - t)
-             self.velocity_profile.append(v)
-        
-        # Ensure hard stop at end
-        self.velocity_profile.append(0.0) 
+        p1_frames = random.randint(*P1_FRAMES_RANGE)
+        creep_steps = random.randint(*CREEP_STEPS_RANGE)
+        self.profile = get_spin_profile(p1_frames, creep_steps)
+        self.velocity_profile = self.profile.velocities
         
-        # === CALCULATE PATH ===
-        total_steps = int(sum(self.velocity_profile))
+        # === CALCULATE PATH (lazy, computed per index) ===
+        total_steps = self.profile.total_steps
         self.path = self.logic.calculate_animation_path(target_number, total_steps)
         
         # === RUNTIME STATE ===
@@ -82,10 +54,11 @@ class SpinAnimation:
         self._last_displayed = -1
         self.last_audio_time = 0 
         
-        self._animate_step()
+        self._clock_handle = self.clock.add(self._animate_step)
 
-    def _animate_step(self):
-        if not self.is_running: return
+    def _animate_step(self, elapsed):
+        """Called by the FrameClock. Returns False when the clock should drop it."""
+        if not self.is_running: return False
         import time 
         
         current_display_number = None
@@ -94,10 +67,15 @@ class SpinAnimation:
         now = time.time()
         
         if self.current_frame < len(self.velocity_profile):
+            # Advance by elapsed time, not by tick count: when a tick comes late,
+            # the missed profile frames are skipped and only the latest is drawn.
+            due_frame = min(int(elapsed / self.FRAME_TIME), len(self.velocity_profile) - 1)
+            if self.current_frame > due_frame: return True # Tick came early, nothing due yet
+            self.current_frame = due_frame
             v = self.velocity_profile[self.current_frame]
             
-            # Accumulate float steps
-            self.float_index += v
+            # Wheel offset straight from the prefix-sum table
+            self.float_index = self.profile.offsets[self.current_frame]
             target_abs_index = int(self.float_index)
             
             # Clamp
@@ -107,14 +85,16 @@ class SpinAnimation:
             head_num = current_display_number
             
             # --- Trail Logic ---
-            if v > 1.5: trail_len = 2 
+            # Longer trail at full speed (fade colors come from gui.palette)
+            if v > 1.5: trail_len = 4
+            elif v > 1.0: trail_len = 2
             elif v > 0.5: trail_len = 1
             else: trail_len = 0 
             
             trail_numbers = [(head_num, 0)]
             if trail_len > 0:
                  for i in range(trail_len):
-                     val = (head_num - 1 - (i + 1)) % 75 + 1
+                     val = self.logic.wrap_number(head_num - (i + 1))
                      trail_numbers.append((val, i + 1))
             
             # --- Sound Logic ---
@@ -147,10 +127,11 @@ class SpinAnimation:
                 # Limit duration to 200ms to allow overlapping but prevent channel exhaustion
                 self.audio.play_se("move", maxtime=200)
                 
-            self._cancel_id = self.root.after(16, self._animate_step)
+            return True
             
         else:
             self._finish(self.path[-1])
+            return False
 
     def _finish(self, final_number):
         self.is_running = False
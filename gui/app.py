@@ -1,9 +1,17 @@
 import customtkinter as ctk
 import tkinter.messagebox as messagebox
 from screeninfo import get_monitors
-from config import APP_NAME, VERSION, WINDOW_WIDTH, WINDOW_HEIGHT, COLORS
+from config import APP_NAME, VERSION, WINDOW_WIDTH, WINDOW_HEIGHT, GRID_BACKEND, EXPLOSION_RENDERER
 from gui.panels import LeftPanel, RightPanel
+from gui.canvas_grid import CanvasRightPanel
 from gui.animations import SpinAnimation
+from gui.frame_clock import FrameClock
+from gui.render_batch import RenderBatch
+from gui.overlay import EffectOverlay
+from gui.quality import QualityGovernor
+from gui.sprites import SpriteAtlas
+from gui.compositor import ExplosionCompositor
+from managers.settings_manager import VolumeSettings
 
 class BingoApp(ctk.CTk):
     def __init__(self, data_manager, game_logic, audio_manager):
@@ -38,8 +46,16 @@ class BingoApp(ctk.CTk):
         init_bgm_vol = self.game_data.get("volume_bgm", 1.0)
         init_se_vol = self.game_data.get("volume_se", 1.0)
         
-        self.audio.set_bgm_volume(init_bgm_vol)
-        self.audio.set_se_volume(init_se_vol)
+        # Applied immediately, saved on a trailing debounce
+        self.volume = VolumeSettings(
+            self.dm, self.audio, scheduler=self,
+            bgm=init_bgm_vol, se=init_se_vol
+        )
+
+        # One shared frame clock drives the spin and all effects
+        self.clock = FrameClock(self)
+        # UI changes made during a tick are applied once, at its end
+        self.batch = RenderBatch(self.clock)
 
         # Components
         self.left_panel = LeftPanel(
@@ -57,7 +73,8 @@ class BingoApp(ctk.CTk):
         self.left_panel.slider_bgm.set(init_bgm_vol)
         self.left_panel.slider_se.set(init_se_vol)
 
-        self.right_panel = RightPanel(self)
+        grid_panel_cls = CanvasRightPanel if GRID_BACKEND == "canvas" else RightPanel
+        self.right_panel = grid_panel_cls(self, board=self.logic.board, batch=self.batch)
         self.right_panel.grid(row=0, column=1, sticky="nsew", padx=(0, 10), pady=10)
         
         # Theme Toggle
@@ -66,10 +83,12 @@ class BingoApp(ctk.CTk):
         # Keybinds
         self.bind("<Control-Shift-R>", self.confirm_reset)
         self.bind("<Control-Shift-r>", self.confirm_reset)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # Animation Init
         self.animator = SpinAnimation(
             root=self,
+            clock=self.clock,
             game_logic=self.logic,
             audio_manager=self.audio,
             on_update_display=self.update_display_during_spin,
@@ -77,6 +96,25 @@ class BingoApp(ctk.CTk):
             on_complete=self.on_spin_complete
         )
 
+        # Effect quality tier, adjusted from the clock's measured frame times
+        self.quality = QualityGovernor(self.dm, self.clock, tier=self.game_data.get("effect_quality"))
+
+        # Effect overlay window: built once after startup, then only shown / hidden
+        self.effect_overlay = EffectOverlay(self)
+        self.after(500, self.effect_overlay.prepare)
+
+        # Pre-rendered effect sprites (Pillow, rendered in the background)
+        self.sprites = SpriteAtlas(self)
+        self.sprites.rebuild(self.current_theme)
+
+        # Optional off-thread explosion rendering (needs Pillow)
+        self.compositor = None
+        if EXPLOSION_RENDERER == "pillow":
+            self.compositor = ExplosionCompositor(self)
+            if not self.compositor.available:
+                print("Pillow not available, explosion uses canvas items")
+                self.compositor = None
+
         # Initial State
         self.refresh_ui()
         self.audio.play_bgm()
@@ -85,21 +123,16 @@ class BingoApp(ctk.CTk):
         self.windowed_geometry = f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}"
 
     def _on_change_bgm_vol(self, val):
-        self.audio.set_bgm_volume(val)
-        # Save (auto-save)
-        # To avoid lag, we could verify if changed significantly, but direct save is safest for "auto save" request
-        # We assume file write is fast enough or OS buffers it.
-        # However, to prevent spam, we can read current SE vol from audio manager or cache it?
-        # Let's just read from loaded data? No that's old.
-        # We need current SE vol.
-        # Let's utilize the slider value properly.
-        se_vol = self.left_panel.slider_se.get()
-        self.dm.save_volume(val, se_vol)
+        # Audio follows the slider right away; the save waits until the drag settles
+        self.volume.set_bgm(val)
 
     def _on_change_se_vol(self, val):
-        self.audio.set_se_volume(val)
-        bgm_vol = self.left_panel.slider_bgm.get()
-        self.dm.save_volume(bgm_vol, val)
+        self.volume.set_se(val)
+
+    def on_close(self):
+        # Persist a debounced volume change that has not been written yet
+        self.volume.flush()
+        self.destroy()
 
     def select_monitor(self, index):
         pass # Deprecated
@@ -145,6 +178,9 @@ class BingoApp(ctk.CTk):
             self.overrideredirect(False) # Restore title bar
             self.geometry(self.windowed_geometry)
 
+        # Keep a running effect on top of the moved window
+        self.effect_overlay.follow_root()
+
     def _add_theme_toggle(self):
         # We'll inject a switch into the LeftPanel's controls frame
         switch = ctk.CTkSwitch(
@@ -172,10 +208,13 @@ class BingoApp(ctk.CTk):
         
         # Refresh grid colors
         self.refresh_ui()
+        
+        # Effect sprites are theme colored
+        self.sprites.rebuild(self.current_theme)
 
     def refresh_ui(self):
         # Update Number
-        self.left_panel.update_number(self.logic.current_number)
+        self.batch.put("number", self.left_panel.update_number, self.logic.current_number)
         
         # Update Grid
         self.right_panel.refresh_all(
@@ -184,8 +223,8 @@ class BingoApp(ctk.CTk):
         )
         
         # Update spin button state
-        # Disable if all numbers derived (75 items in history)
-        is_full = len(self.logic.history) >= 75
+        # Disable if all numbers drawn
+        is_full = self.logic.is_finished()
         # Also check if animator is running to avoid re-enabling during spin if refreshed
         is_running = self.animator.is_running if hasattr(self, 'animator') else False
         self.left_panel.set_spin_enabled(not is_full and not is_running)
@@ -204,11 +243,13 @@ class BingoApp(ctk.CTk):
         self.left_panel.set_spin_enabled(False)
 
         # 3. Start Animation
+        # The flying number sprite renders in the background while the wheel spins
+        self.sprites.prepare_number(target)
         self.animator.start(target)
 
     def update_display_during_spin(self, number):
-        # During heavy spin, we can just update the number
-        self.left_panel.update_number(number)
+        # During heavy spin, we can just update the number (once per frame)
+        self.batch.put("number", self.left_panel.update_number, number)
 
     def on_step_finish(self, data):
         """
@@ -226,33 +267,30 @@ class BingoApp(ctk.CTk):
                 
                 # Check if this num is the current target being spun
                 # (We can check via logic.current_number, usually)
-                
-                is_target = (num == self.logic.current_number)
-                
-                if num in self.logic.history and not is_target:
-                     state = "hit"
-                else:
-                     state = "normal"
-                     
-                self.right_panel.update_cell_state(num, state, is_cursor=False)
+                self.right_panel.restore_cell(num, pending=self.logic.current_number)
         
         self._last_highlighted_cells = set()
 
         # 2. Parse Data
         if isinstance(data, list):
+            # In raffle mode several trail numbers share one cell; the head wins
+            seen_cells = set()
             for num, intensity in data:
+                cell = self.right_panel.board.cell_of(num)
+                if cell in seen_cells: continue
+                seen_cells.add(cell)
                 self.right_panel.update_cell_state(num, "normal", is_cursor=True, trail_intensity=intensity)
                 self._last_highlighted_cells.add(num)
                 
             if data:
                 head_num = data[0][0]
-                self.left_panel.update_number(head_num)
+                self.batch.put("number", self.left_panel.update_number, head_num)
                 
         else:
             number = data
             self.right_panel.update_cell_state(number, "normal", is_cursor=True)
             self._last_highlighted_cells.add(number)
-            self.left_panel.update_number(number)
+            self.batch.put("number", self.left_panel.update_number, number)
 
 
     def on_spin_complete(self, number):
@@ -274,23 +312,30 @@ class BingoApp(ctk.CTk):
         
         def on_effect_complete():
              # This runs after explosion fades
-             is_full = len(self.logic.history) >= 75
+             self.quality.evaluate()
+             is_full = self.logic.is_finished()
              self.left_panel.set_spin_enabled(not is_full)
 
-        if start_bbox:
+        # Quality "off" skips the flight / explosion entirely
+        if start_bbox and self.quality.settings:
             from gui.effects import FlyingNumberEffect
             
             FlyingNumberEffect(
                 root=self,
+                clock=self.clock,
+                overlay=self.effect_overlay,
                 start_bbox=start_bbox,
                 end_widget=end_widget,
                 number=number,
                 theme=self.current_theme,
                 on_arrive=on_arrive_at_target, 
-                on_complete=on_effect_complete
+                on_complete=on_effect_complete,
+                quality=self.quality.settings,
+                sprites=self.sprites,
+                compositor=self.compositor
             )
         else:
-            # Fallback if bbox failed
+            # Fallback if bbox failed (or effects are off)
             # If no bbox, means we can't animate, so just do the final steps
             on_arrive_at_target()
             on_effect_complete()
@@ -312,10 +357,10 @@ class BingoApp(ctk.CTk):
     def _animate_impact(self, number):
         # Bright Flash of text color
         def set_impact_style():
-            self.left_panel.lbl_number.configure(text_color=COLORS[self.current_theme]["accent_cursor"])
+            self.left_panel.set_number_accent(True)
             
         def reset_impact_style():
-            self.left_panel.lbl_number.configure(text_color=COLORS[self.current_theme]["text"])
+            self.left_panel.set_number_accent(False)
 
         set_impact_style()
         self.after(300, reset_impact_style)
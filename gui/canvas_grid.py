@@ -0,0 +1,111 @@
+import tkinter as tk
+from config import GRID_COLUMNS
+from gui.panels import RightPanel
+
+class CanvasRightPanel(RightPanel):
+    """
+    Grid backend that draws every cell as items on ONE tkinter.Canvas
+    (rounded rectangle + text) instead of a CTkFrame/CTkLabel pair per cell.
+    Style changes are plain itemconfigure calls, which skip CTk's redraw path.
+    Same interface as RightPanel (update_cell_state / get_cell_bbox / refresh_all).
+    """
+    CELL_PAD = 4
+    CORNER_RADIUS = 5
+
+    def _create_grid(self):
+        self._columns = GRID_COLUMNS
+        self._rows = -(-self.board.cell_count // self._columns)
+        self._cell_rects = {} # cell index -> (x1, y1, x2, y2) in canvas coords
+        self._font_size = None
+
+        self.canvas = tk.Canvas(self, bg=self._colors["panel_bg"], highlightthickness=0, bd=0)
+        self.canvas.pack(fill="both", expand=True)
+
+        # Items are created once; layout only moves them
+        for cell in range(self.board.cell_count):
+            shape = self.canvas.create_polygon(
+                0, 0, 0, 0, smooth=True,
+                fill=self._colors["cell_bg"], outline="", width=0
+            )
+            text = self.canvas.create_text(
+                0, 0, text=self._cell_text(cell),
+                fill=self._colors["text_dim"], justify="center"
+            )
+            self.grid_cells[cell] = {"shape": shape, "text": text}
+
+        self.canvas.bind("<Configure>", self._on_resize)
+
+    def _on_resize(self, event):
+        w, h = event.width, event.height
+        if w <= 1 or h <= 1: return
+
+        pad = self.CELL_PAD
+        cell_w = w / self._columns
+        cell_h = h / self._rows
+
+        for cell, items in self.grid_cells.items():
+            row = cell // self._columns
+            col = cell % self._columns
+            x1 = col * cell_w + pad
+            y1 = row * cell_h + pad
+            x2 = (col + 1) * cell_w - pad
+            y2 = (row + 1) * cell_h - pad
+            self._cell_rects[cell] = (x1, y1, x2, y2)
+
+            self.canvas.coords(items["shape"], *self._round_rect_points(x1, y1, x2, y2, self.CORNER_RADIUS))
+            self.canvas.coords(items["text"], (x1 + x2) / 2, (y1 + y2) / 2)
+
+        # Scale the numbers with the cell (pixel size = negative Tk font size)
+        if self.board.is_raffle:
+            font_size = -max(8, int(min(cell_h * 0.2, cell_w * 0.11)))
+        else:
+            font_size = -max(8, int(min(cell_h, cell_w) * 0.55))
+        if font_size != self._font_size:
+            self._font_size = font_size
+            for items in self.grid_cells.values():
+                self.canvas.itemconfigure(items["text"], font=("Arial", font_size, "bold"))
+
+    def _round_rect_points(self, x1, y1, x2, y2, r):
+        # Control points for a smoothed polygon = rectangle with rounded corners
+        return (
+            x1 + r, y1, x2 - r, y1, x2, y1, x2, y1 + r,
+            x2, y2 - r, x2, y2, x2 - r, y2, x1 + r, y2,
+            x1, y2, x1, y2 - r, x1, y1 + r, x1, y1,
+        )
+
+    def _apply_theme(self):
+        super()._apply_theme()
+        if hasattr(self, 'canvas'):
+            self.canvas.configure(bg=self._colors["panel_bg"])
+
+    def _render_style(self, cell, bg, fg, border_width, border_color):
+        items = self.grid_cells[cell]
+
+        rendered = self._rendered.setdefault(cell, {})
+        frame_style = (bg, border_width, border_color)
+        if rendered.get("frame") != frame_style:
+            outline = border_color if border_width else ""
+            self.canvas.itemconfigure(items["shape"], fill=bg, outline=outline, width=border_width)
+            rendered["frame"] = frame_style
+        if rendered.get("fg") != fg:
+            self.canvas.itemconfigure(items["text"], fill=fg)
+            rendered["fg"] = fg
+
+    def _render_text(self, cell, text):
+        rendered = self._rendered.setdefault(cell, {})
+        if rendered.get("text") != text:
+            self.canvas.itemconfigure(self.grid_cells[cell]["text"], text=text)
+            rendered["text"] = text
+
+    def get_cell_bbox(self, num):
+        """Returns (x, y, width, height) of the cell relative to the root window"""
+        cell = self.board.cell_of(num)
+        if cell is None or cell not in self._cell_rects: return None
+
+        x1, y1, x2, y2 = self._cell_rects[cell]
+        try:
+            ox = self.canvas.winfo_rootx() - self.winfo_toplevel().winfo_rootx()
+            oy = self.canvas.winfo_rooty() - self.winfo_toplevel().winfo_rooty()
+            return (int(ox + x1), int(oy + y1), int(x2 - x1), int(y2 - y1))
+        except:
+            return None
@@ -0,0 +1,79 @@
+class CanvasItemPool:
+    """
+    Reusable canvas items of one type ("oval", "line", "text", ...).
+    Per frame: begin(), place(...) once per visible element, end().
+    - Slot i keeps the same canvas item across frames and is moved with coords().
+    - Style options are only sent for keys that changed for that slot.
+    - Slots not used in a frame are hidden, not deleted.
+    New items are only created when a frame needs more slots than ever before.
+    """
+    def __init__(self, canvas, kind, tag, **defaults):
+        """
+        :param kind: canvas item type, used as canvas.create_<kind>
+        :param tag: tag shared by every item of the pool (used for z-ordering)
+        """
+        self.canvas = canvas
+        self.kind = kind
+        self.tag = tag
+        self.defaults = defaults
+
+        self._items = []
+        self._styles = []   # last style sent to each slot
+        self._visible = []
+        self._used = 0
+        self.grew = False   # Items were created since the last begin()
+
+    def begin(self):
+        self._used = 0
+        self.grew = False
+
+    def place(self, *coords, **style):
+        i = self._used
+        self._used += 1
+
+        if i == len(self._items):
+            create = getattr(self.canvas, "create_" + self.kind)
+            options = dict(self.defaults)
+            options.update(style)
+            item = create(*coords, tags=(self.tag,), **options)
+            self._items.append(item)
+            self._styles.append(style)
+            self._visible.append(True)
+            self.grew = True
+            return item
+
+        item = self._items[i]
+        self.canvas.coords(item, *coords)
+
+        prev = self._styles[i]
+        changed = {k: v for k, v in style.items() if prev.get(k) != v}
+        if not self._visible[i]:
+            changed["state"] = "normal"
+            self._visible[i] = True
+        if changed:
+            self.canvas.itemconfigure(item, **changed)
+            prev.update(style)
+        return item
+
+    def end(self):
+        """Hide every slot that was not placed this frame"""
+        for i in range(self._used, len(self._items)):
+            if self._visible[i]:
+                self.canvas.itemconfigure(self._items[i], state="hidden")
+                self._visible[i] = False
+
+    def hide_all(self):
+        self.begin()
+        self.end()
+
+    def destroy(self):
+        self.canvas.delete(self.tag)
+        self._items, self._styles, self._visible = [], [], []
+        self._used = 0
+
+
+def restack(canvas, pools):
+    """Re-apply bottom-to-top order after any pool created new items"""
+    if any(p.grew for p in pools):
+        for p in pools:
+            canvas.tag_raise(p.tag)
@@ -0,0 +1,144 @@
+import queue
+import threading
+from gui.particles import LINE
+
+try:
+    from PIL import Image, ImageColor, ImageDraw, ImageTk
+except ImportError:
+    Image = None
+
+class ExplosionScene:
+    """Snapshot of one explosion frame, handed to the worker (plain data only)"""
+    def __init__(self, token, cx, cy, flash_r, waves, particles):
+        """
+        :param token: id of the effect, frames of finished effects are dropped
+        :param waves: [(x, y, radius, width, color, life), ...]
+        :param particles: [(x, y, vx, vy, life, size, kind, color), ...]
+        """
+        self.token = token
+        self.cx = cx
+        self.cy = cy
+        self.flash_r = flash_r
+        self.waves = waves
+        self.particles = particles
+
+class ExplosionCompositor:
+    """
+    Worker thread that rasterizes explosion frames into one RGBA image.
+    - The Tk thread submits a scene per physics step; if the worker falls
+      behind, only the newest scene is rendered.
+    - Particles fade with real alpha (life) and blend where they overlap.
+    - The finished frame is cropped to its visible content (getbbox), so the
+      Tk thread only converts and shows one small image per tick.
+    The overlay window uses a color key for transparency, which cannot show
+    partial alpha, so the final alpha is cut at ALPHA_CUTOFF before display.
+    """
+    ALPHA_CUTOFF = 96
+    LINE_WIDTH = 2
+
+    def __init__(self, root):
+        self.root = root
+        self.available = Image is not None
+        self._scenes = queue.Queue()
+        self._frames = queue.Queue()
+        self._rgb = {} # color string -> (r, g, b)
+        self._next_token = 0
+        if self.available:
+            threading.Thread(target=self._worker_loop, name="ExplosionCompositor", daemon=True).start()
+
+    # --- Tk thread ---
+    def new_token(self):
+        self._next_token += 1
+        return self._next_token
+
+    def submit(self, scene):
+        self._scenes.put(scene)
+
+    def latest(self, token):
+        """Newest finished frame of token as (PhotoImage, x, y), or None if nothing new"""
+        frame = None
+        while True:
+            try:
+                item = self._frames.get_nowait()
+            except queue.Empty:
+                break
+            if item[0] == token:
+                frame = item
+        if frame is None:
+            return None
+
+        _, image, x, y = frame
+        if image is None:
+            return (None, 0, 0) # Frame was empty
+        return (ImageTk.PhotoImage(image, master=self.root), x, y)
+
+    # --- Worker thread ---
+    def _worker_loop(self):
+        while True:
+            scene = self._scenes.get()
+            # Skip to the newest scene
+            while True:
+                try:
+                    scene = self._scenes.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                image, x, y = self._render(scene)
+            except Exception as e:
+                print(f"Explosion composite error: {e}")
+                continue
+            self._frames.put((scene.token, image, x, y))
+
+    def _color(self, color, alpha):
+        rgb = self._rgb.get(color)
+        if rgb is None:
+            rgb = self._rgb[color] = ImageColor.getrgb(color)[:3]
+        return rgb + (max(0, min(255, int(alpha * 255))),)
+
+    def _render(self, scene):
+        # 1. Frame bounds (everything is drawn relative to left/top)
+        reach = max([scene.flash_r] + [w[2] + w[3] for w in scene.waves])
+        xs = [scene.cx - reach, scene.cx + reach]
+        ys = [scene.cy - reach, scene.cy + reach]
+        for px, py, vx, vy, *_ in scene.particles:
+            xs += (px, px - vx * 2) # Head and line tail
+            ys += (py, py - vy * 2)
+        pad = 16 # Largest particle radius + line width
+        left, top = int(min(xs)) - pad, int(min(ys)) - pad
+        width, height = int(max(xs)) + pad - left, int(max(ys)) + pad - top
+
+        image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image, "RGBA") # Blends fills with their alpha
+
+        # 2. Flash
+        if scene.flash_r > 0:
+            r = scene.flash_r
+            x, y = scene.cx - left, scene.cy - top
+            draw.ellipse((x - r, y - r, x + r, y + r), fill=(255, 255, 255, 255))
+
+        # 3. Shockwaves
+        for wx, wy, radius, w, color, life in scene.waves:
+            x, y = wx - left, wy - top
+            draw.ellipse(
+                (x - radius, y - radius, x + radius, y + radius),
+                outline=self._color(color, life), width=max(1, int(w))
+            )
+
+        # 4. Particles (alpha = remaining life)
+        for px, py, vx, vy, life, size, kind, color in scene.particles:
+            x, y = px - left, py - top
+            fill = self._color(color, life)
+            if kind == LINE:
+                draw.line((x - vx * 2, y - vy * 2, x, y), fill=fill, width=self.LINE_WIDTH)
+            else:
+                r = size * life
+                draw.ellipse((x - r, y - r, x + r, y + r), fill=fill)
+
+        # 5. Color-key overlay: partial alpha -> opaque or transparent
+        alpha = image.getchannel("A").point(lambda a: 255 if a >= self.ALPHA_CUTOFF else 0)
+        image.putalpha(alpha)
+
+        bbox = image.getbbox()
+        if bbox is None:
+            return None, 0, 0
+        return image.crop(bbox), left + bbox[0], top + bbox[1]
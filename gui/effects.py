@@ -1,47 +1,13 @@
-import customtkinter as ctk
 import random
-import math
 from config import COLORS
-
-class Particle:
-    def __init__(self, x, y, color, p_type="circle"):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.type = p_type
-        
-        # Explosion Physics
-        angle = random.uniform(0, 2 * math.pi)
-        
-        # Speed varies by type
-        if p_type == "line":
-            speed = random.uniform(10, 25) # Fast streaks
-            self.drag = 0.85
-            self.size = random.uniform(2, 4)
-            self.length = random.uniform(10, 30)
-        else:
-            speed = random.uniform(2, 12)
-            self.drag = 0.95
-            self.size = random.uniform(4, 12)
-            self.length = 0
-
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed
-        
-        self.gravity = 0.4 if p_type != "line" else 0.1
-        self.life = 1.0
-        self.decay = random.uniform(0.01, 0.03)
-
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += self.gravity
-        self.vx *= self.drag
-        self.vy *= self.drag
-        self.life -= self.decay
+from gui.particles import ParticlePool, CIRCLE, LINE
+from gui.canvas_items import restack
+from gui.quality import QUALITY_TIERS
+from gui.sprites import effect_colors
+from gui.compositor import ExplosionScene
 
 class Shockwave:
-    def __init__(self, x, y, color):
+    def __init__(self, x, y, color, duration=1.0):
         self.x = x
         self.y = y
         self.color = color
@@ -49,7 +15,7 @@ class Shockwave:
         self.max_radius = 300
         self.width = 20
         self.life = 1.0
-        self.decay = 0.04
+        self.decay = 0.04 / duration
         self.speed = 15
 
     def update(self):
@@ -58,15 +24,30 @@ class Shockwave:
         self.width *= 0.95
 
 class FlyingNumberEffect:
-    def __init__(self, root, start_bbox, end_widget, number, theme, on_arrive=None, on_complete=None):
+    EXPLOSION_STEP = 0.02 # Seconds per explosion physics step
+    EXPLOSION_CIRCLES = 200 # At particles = 1.0 (scaled by the quality tier)
+    EXPLOSION_LINES = 50
+
+    def __init__(self, root, clock, overlay, start_bbox, end_widget, number, theme, on_arrive=None, on_complete=None, quality=None, sprites=None, compositor=None):
+        """
+        :param clock: FrameClock driving flight and explosion frames
+        :param overlay: EffectOverlay whose canvas the effect draws on
+        :param quality: tier settings from gui.quality.QUALITY_TIERS (None -> "high")
+        :param sprites: SpriteAtlas with pre-rendered discs / number (None -> primitives only)
+        :param compositor: ExplosionCompositor; when set the explosion is rasterized off-thread
+        """
         self.root = root
+        self.clock = clock
         self.on_arrive = on_arrive
         self.on_complete = on_complete
         self.number = number 
         self.theme = theme 
+        self.quality = quality or QUALITY_TIERS["high"]
         
         # Colors
-        self.theme_colors = [COLORS[theme]["accent_hit"], "#FFD700", "#FFEC8B", "#FFFFFF", "#C0C0C0"] 
+        self.theme_colors = effect_colors(theme)
+        self.sprites = sprites
+        self.compositor = compositor
         
         # 1. Setup Coordinates
         self.start_x = start_bbox[0]
@@ -95,23 +76,27 @@ class FlyingNumberEffect:
             self.start_cx, self.start_cy = 100, 100
             self.target_cx, self.target_cy = 200, 200
 
-        # 2. Create Overlay Window IMMEDIATELY
-        self.overlay = ctk.CTkToplevel(self.root)
-        self.overlay.overrideredirect(True)
-        
-        trans_color = "#000001"
-        self.overlay.configure(fg_color=trans_color)
-        self.overlay.attributes("-transparentcolor", trans_color)
-        self.overlay.attributes("-topmost", True)
-        
-        x = self.root.winfo_rootx()
-        y = self.root.winfo_rooty()
-        w = self.root.winfo_width()
-        h = self.root.winfo_height()
-        self.overlay.geometry(f"{w}x{h}+{x}+{y}")
-        
-        self.canvas = ctk.CTkCanvas(self.overlay, width=w, height=h, bg=trans_color, highlightthickness=0)
-        self.canvas.pack(fill="both", expand=True)
+        # 2. Borrow the shared overlay canvas (built once by the app)
+        self.overlay = overlay
+        self.canvas = overlay.acquire()
+
+        # Reusable canvas items, one per particle slot (listed bottom -> top)
+        self._flash_items = overlay.pool("flash", "oval", fill="#FFFFFF", outline="")
+        self._wave_items = overlay.pool("wave", "oval", fill="")
+        self._trail_items = overlay.pool("trail", "oval", outline="")
+        self._trail_sprites = overlay.pool("trail_sprite", "image")
+        self._circle_items = overlay.pool("circle", "oval", outline="")
+        self._circle_sprites = overlay.pool("circle_sprite", "image")
+        self._line_items = overlay.pool("line", "line", width=2)
+        self._frame_items = overlay.pool("explosion_frame", "image", anchor="nw")
+        self._glow_items = overlay.pool("glow", "oval", fill="", width=2)
+        self._text_items = overlay.pool("text", "text", fill="#FFFFFF")
+        self._number_sprites = overlay.pool("number_sprite", "image")
+        self._layers = [
+            self._flash_items, self._wave_items, self._trail_items, self._trail_sprites,
+            self._circle_items, self._circle_sprites, self._line_items, self._frame_items,
+            self._glow_items, self._text_items, self._number_sprites
+        ]
 
         # Animation State
         self.duration = 400 
@@ -127,24 +112,23 @@ class FlyingNumberEffect:
         self.ctrl_x = mid_x + random.randint(-50, 50)
         self.ctrl_y = mid_y - 150 # Curve UP usually looks nice
         
-        # Particles Container
-        self.particles = []
+        # Particles Container (struct-of-arrays pools)
+        self.n_circles = int(self.EXPLOSION_CIRCLES * self.quality["particles"])
+        self.n_lines = int(self.EXPLOSION_LINES * self.quality["particles"])
+        self.particles = ParticlePool(self.n_circles + self.n_lines)
         self.shockwaves = []
-        self.trail_particles = []
+        self.trail_particles = ParticlePool(64)
         
-        # Start Flight
-        self.root.after(10, self._animate_flight)
+        # Start Flight (first frame on the next clock tick)
+        self.clock.add(self._animate_flight)
 
-    def _animate_flight(self):
-        self.canvas.delete("all")
-        
-        t = self.current_step / self.steps
+    def _flight_pos(self, step):
+        t = step / self.steps
         
         # Ease In Out
         # if t < 0.5: eased_t = 2 * t * t
         # else: eased_t = 1 - pow(-2 * t + 2, 2) / 2
-        eased_t = t # Linear t for bezier math, actually visual is better if we just use t? 
-        # Or apply ease to t BEFORE bezier.
+        # Linear t for bezier math looks best
         
         # Quadratic Bezier: (1-t)^2 * P0 + 2(1-t)t * P1 + t^2 * P2
         u = 1 - t
@@ -153,54 +137,73 @@ class FlyingNumberEffect:
         
         curr_x = (uu * self.start_cx) + (2 * u * t * self.ctrl_x) + (tt * self.target_cx)
         curr_y = (uu * self.start_cy) + (2 * u * t * self.ctrl_y) + (tt * self.target_cy)
+        return curr_x, curr_y
+
+    def _step_trail(self, step):
+        curr_x, curr_y = self._flight_pos(step)
         
         # Spawn Trail Particles
-        for _ in range(5):
-            # Trail is simple fading dots
-            tp = Particle(curr_x, curr_y, random.choice(self.theme_colors), p_type="circle")
-            tp.vx *= 0.2 # low speed
-            tp.vy *= 0.2
-            tp.life = 0.6 # short life
-            tp.size = random.randint(2, 6)
-            self.trail_particles.append(tp)
+        # Trail is simple fading dots: low speed, short life
+        self.trail_particles.emit(
+            self.quality["trail"], curr_x, curr_y, CIRCLE, self.theme_colors,
+            speed=(2, 12), speed_scale=0.2, size=(2, 6),
+            drag=0.95, gravity=0.4, life=0.6
+        )
         
-        # Update & Draw Trail
-        alive_trail = []
-        for p in self.trail_particles:
-            p.update()
-            if p.life > 0:
-                r = p.size * p.life
-                self.canvas.create_oval(
-                    p.x - r, p.y - r, p.x + r, p.y + r,
-                    fill=p.color, outline=""
-                )
-                alive_trail.append(p)
-        self.trail_particles = alive_trail
+        # Update Trail
+        self.trail_particles.step()
+
+    def _animate_flight(self, elapsed):
+        """FrameClock callback. Steps are time-based; late ticks catch up and draw once."""
+        due_step = min(self.steps, int(elapsed * 1000 / self.interval))
+        if due_step < self.current_step: return True # Tick came early
         
-        # Draw Main Number (Glowing)
-        # Glow
-        glow_r = 40
-        self.canvas.create_oval(
-            curr_x - glow_r, curr_y - glow_r, curr_x + glow_r, curr_y + glow_r,
-            fill="", outline=COLORS[self.theme]["accent_hit"], width=2
-        )
+        while self.current_step <= due_step:
+            self._step_trail(self.current_step)
+            self.current_step += 1
         
-        # Text
-        font_size = int(20 + 40 * t) # Grow from 20 to 60
-        self.canvas.create_text(
-            curr_x, curr_y,
-            text=str(self.number),
-            font=("Arial", font_size, "bold"),
-            fill="#FFFFFF"
-        )
+        self._begin_frame()
+        t = due_step / self.steps
+        curr_x, curr_y = self._flight_pos(due_step)
         
-        self.current_step += 1
+        # Draw Trail
+        sprites = self.sprites
+        for x, y, vx, vy, life, size, kind, color in self.trail_particles.rows():
+            r = size * life
+            image = sprites and sprites.disc(color, r)
+            if image:
+                self._trail_sprites.place(x, y, image=image)
+            else:
+                self._trail_items.place(x - r, y - r, x + r, y + r, fill=color)
         
-        if self.current_step <= self.steps:
-            self.root.after(self.interval, self._animate_flight)
+        # Draw Main Number (Glowing)
+        font_size = int(20 + 40 * t) # Grow from 20 to 60
+        image = sprites and sprites.number(self.number, font_size)
+        if image:
+            # Glow ring and text in one pre-rendered image
+            self._number_sprites.place(curr_x, curr_y, image=image)
         else:
-            self.exp_cx, self.exp_cy = curr_x, curr_y # Handover exact pos
-            self._start_explosion()
+            # Glow
+            glow_r = 40
+            self._glow_items.place(
+                curr_x - glow_r, curr_y - glow_r, curr_x + glow_r, curr_y + glow_r,
+                outline=COLORS[self.theme]["accent_hit"]
+            )
+            
+            # Text
+            self._text_items.place(
+                curr_x, curr_y,
+                text=str(self.number),
+                font=("Arial", font_size, "bold")
+            )
+        self._end_frame()
+        
+        if self.current_step <= self.steps:
+            return True
+        
+        self.exp_cx, self.exp_cy = curr_x, curr_y # Handover exact pos
+        self._start_explosion()
+        return False
 
     def _start_explosion(self):
         # Trigger UI update
@@ -209,99 +212,158 @@ class FlyingNumberEffect:
             
         # Init Explosion Objects
         # A. Shockwave Ring
-        self.shockwaves.append(Shockwave(self.exp_cx, self.exp_cy, "#FFFFFF"))
-        self.shockwaves.append(Shockwave(self.exp_cx, self.exp_cy, COLORS[self.theme]["accent_hit"]))
+        duration = self.quality["duration"]
+        self.shockwaves.append(Shockwave(self.exp_cx, self.exp_cy, "#FFFFFF", duration))
+        self.shockwaves.append(Shockwave(self.exp_cx, self.exp_cy, COLORS[self.theme]["accent_hit"], duration))
         
         # B. Particles (200+)
-        for _ in range(200):
-            color = random.choice(self.theme_colors)
-            p = Particle(self.exp_cx, self.exp_cy, color, p_type="circle")
-            self.particles.append(p)
+        self.particles.emit(
+            self.n_circles, self.exp_cx, self.exp_cy, CIRCLE, self.theme_colors,
+            speed=(2, 12), size=(4, 12), drag=0.95, gravity=0.4,
+            decay=(0.01 / duration, 0.03 / duration)
+        )
             
         # C. Fast Streaks (Lines)
-        for _ in range(50):
-            color = "#FFFFFF"
-            p = Particle(self.exp_cx, self.exp_cy, color, p_type="line")
-            self.particles.append(p)
+        self.particles.emit(
+            self.n_lines, self.exp_cx, self.exp_cy, LINE, ["#FFFFFF"],
+            speed=(10, 25), size=(2, 4), drag=0.85, gravity=0.1,
+            decay=(0.01 / duration, 0.03 / duration)
+        )
 
-        self.flash_life = 5 
+        self.flash_life = self.flash_frames = max(1, round(5 * duration))
+        self._flash_frame = 0 # flash_life of the step being drawn
+        self._explosion_steps = 0
+        
+        if self.compositor:
+            self._frame_token = self.compositor.new_token()
+            self._frame = None # (PhotoImage, x, y) on screen; keeps the image alive
         
-        self._animate_explosion()
+        self.clock.add(self._animate_explosion)
 
-    def _animate_explosion(self):
-        if not self.particles and not self.shockwaves and self.flash_life <= 0:
+    def _animate_explosion(self, elapsed):
+        """FrameClock callback. Physics runs in fixed EXPLOSION_STEPs, drawing only after a step."""
+        due = int(elapsed / self.EXPLOSION_STEP) + 1
+        stepped = False
+        while self._explosion_steps < due and self._explosion_alive():
+            self._step_explosion()
+            self._explosion_steps += 1
+            stepped = True
+        
+        if not self._explosion_alive() and self._flash_frame <= 0:
             self._finish()
-            return
-
-        self.canvas.delete("all")
+            return False
         
+        # No new step this tick: the canvas already shows the current state
+        if not stepped:
+            return True
+        
+        if self.compositor:
+            self._composite_explosion()
+        else:
+            self._draw_explosion()
+        self._flash_frame = 0 # Flash of a step is drawn once
+        return True
+
+    def _explosion_alive(self):
+        return bool(len(self.particles) or self.shockwaves or self.flash_life > 0)
+
+    def _step_explosion(self):
         # 1. Flash
+        self._flash_frame = self.flash_life
         if self.flash_life > 0:
-            # Draw semi-transparent white rect over everything? 
-            # Tkinter canvas transparency is tricky. 
-            # We can use stipple='gray50' or simply a big white circle
-            r = 1000
-            # Simulating flash by just drawing big white circle that shrinks?
-            # Or just skip full screen flash if it blocks view too much.
-            # Let's do a central white glow.
-            flash_r = 300 * (self.flash_life / 5)
-            self.canvas.create_oval(
-                 self.exp_cx - flash_r, self.exp_cy - flash_r,
-                 self.exp_cx + flash_r, self.exp_cy + flash_r,
-                 fill="#FFFFFF", outline=""
-            )
             self.flash_life -= 1
-
+        
         # 2. Shockwaves
         alive_waves = []
         for s in self.shockwaves:
             s.update()
             if s.life > 0:
-                # Draw ring
-                width = s.width * s.life
-                # tk create_oval outline width
-                self.canvas.create_oval(
-                    s.x - s.radius, s.y - s.radius, s.x + s.radius, s.y + s.radius,
-                    outline=s.color, width=width
-                )
                 alive_waves.append(s)
         self.shockwaves = alive_waves
         
-        # 3. Particles
-        alive_particles = []
-        for p in self.particles:
-            p.update()
-            if p.life > 0:
-                alpha_sim = p.color # Tkinter doesn't do alpha easily without hack.
-                # We assume background is black-transparent.
-                
-                if p.type == "line":
-                    # Draw Line based on velocity vector
-                    tail_x = p.x - p.vx * 2
-                    tail_y = p.y - p.vy * 2
-                    self.canvas.create_line(
-                        tail_x, tail_y, p.x, p.y,
-                        fill=p.color, width=2
-                    )
-                else:
-                    # Draw Circle
-                    r = p.size * p.life
-                    self.canvas.create_oval(
-                        p.x - r, p.y - r, p.x + r, p.y + r,
-                        fill=p.color, outline=""
-                    )
-                alive_particles.append(p)
+        # 3. Particles (one batch update + bulk compaction)
+        self.particles.step()
+
+    def _begin_frame(self):
+        for pool in self._layers:
+            pool.begin()
+
+    def _end_frame(self):
+        # Unused slots are hidden; only new items need restacking
+        for pool in self._layers:
+            pool.end()
+        restack(self.canvas, self._layers)
+
+    def _flash_radius(self):
+        return self.quality["flash"] * (self._flash_frame / self.flash_frames)
+
+    def _composite_explosion(self):
+        """Hand this step's scene to the worker, show its newest finished frame"""
+        self.compositor.submit(ExplosionScene(
+            self._frame_token, self.exp_cx, self.exp_cy,
+            self._flash_radius() if self._flash_frame > 0 else 0,
+            [(s.x, s.y, s.radius, s.width * s.life, s.color, s.life) for s in self.shockwaves],
+            list(self.particles.rows())
+        ))
         
-        self.particles = alive_particles
+        frame = self.compositor.latest(self._frame_token)
+        if frame is not None:
+            self._frame = frame
         
-        if self.particles or self.shockwaves or self.flash_life > 0:
-            self.root.after(20, self._animate_explosion)
-        else:
-            self._finish()
+        self._begin_frame()
+        if self._frame and self._frame[0]:
+            image, x, y = self._frame
+            self._frame_items.place(x, y, image=image)
+        self._end_frame()
+
+    def _draw_explosion(self):
+        self._begin_frame()
+        
+        # 1. Flash
+        if self._flash_frame > 0:
+            # Tkinter canvas transparency is tricky, so no full screen flash.
+            # Simulate it with a central white glow that shrinks.
+            flash_r = self._flash_radius()
+            self._flash_items.place(
+                 self.exp_cx - flash_r, self.exp_cy - flash_r,
+                 self.exp_cx + flash_r, self.exp_cy + flash_r
+            )
+
+        # 2. Shockwaves
+        for s in self.shockwaves:
+            # Draw ring
+            width = s.width * s.life
+            # tk create_oval outline width
+            self._wave_items.place(
+                s.x - s.radius, s.y - s.radius, s.x + s.radius, s.y + s.radius,
+                outline=s.color, width=width
+            )
+        
+        # 3. Particles
+        sprites = self.sprites
+        for x, y, vx, vy, life, size, kind, color in self.particles.rows():
+            # Tkinter doesn't do alpha easily without hack.
+            # We assume background is black-transparent.
             
+            if kind == LINE:
+                # Draw Line based on velocity vector
+                tail_x = x - vx * 2
+                tail_y = y - vy * 2
+                self._line_items.place(tail_x, tail_y, x, y, fill=color)
+            else:
+                # Draw Circle
+                r = size * life
+                image = sprites and sprites.disc(color, r)
+                if image:
+                    self._circle_sprites.place(x, y, image=image)
+                else:
+                    self._circle_items.place(x - r, y - r, x + r, y + r, fill=color)
+        
+        self._end_frame()
+
     def _finish(self):
-        if hasattr(self, 'overlay') and self.overlay:
-            self.overlay.destroy()
+        # Hide (not destroy) the shared overlay; its items are reused next time
+        self.overlay.release()
             
         if self.on_complete:
             self.on_complete()
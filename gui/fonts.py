@@ -0,0 +1,21 @@
+from functools import lru_cache
+
+try:
+    from PIL import ImageFont
+except ImportError:
+    ImageFont = None
+
+@lru_cache(maxsize=None)
+def find_truetype(candidates):
+    """
+    First loadable TrueType font in candidates (file names or paths), or None.
+    :param candidates: tuple, searched in order (Pillow also looks in the system font dirs)
+    """
+    if ImageFont is None: return None
+    for path in candidates:
+        try:
+            ImageFont.truetype(path, 10)
+            return path
+        except OSError:
+            continue
+    return None
@@ -0,0 +1,84 @@
+import time
+
+class FrameClock:
+    """
+    One Tk timer that drives every active animation (spin, flight, explosion).
+    - Ticks are scheduled against a fixed perf_counter grid, so the time spent
+      inside callbacks does not accumulate as drift.
+    - Each animation receives the elapsed time since it was added and advances
+      on that, so a late tick skips frames instead of stretching the animation.
+    """
+    def __init__(self, root, fps=60):
+        self.root = root
+        self.frame_time = 1.0 / fps
+        self._animations = {} # handle -> (callback, start_time)
+        self._next_handle = 0
+        self._running = False # A tick is scheduled or executing
+        self._origin = None # perf_counter of tick 0 while running
+        self._last_tick = None
+        self._listeners = [] # listener(frame_seconds) after every tick
+        self._tick_end = [] # callback() after the animations of every tick
+        self.in_tick = False # True while animation callbacks run
+
+    def add(self, callback):
+        """
+        Register callback(elapsed_seconds) -> bool. Returning False removes it.
+        The first call happens on the next tick. Returns a handle for remove().
+        """
+        handle = self._next_handle
+        self._next_handle += 1
+        self._animations[handle] = (callback, time.perf_counter())
+
+        if not self._running:
+            self._running = True
+            self._origin = time.perf_counter()
+            self._last_tick = None
+            self.root.after(0, self._tick)
+        return handle
+
+    def remove(self, handle):
+        self._animations.pop(handle, None)
+
+    def add_listener(self, listener):
+        """
+        Register listener(frame_seconds), called after each tick with the real
+        time since the previous tick of the same run (callback work included).
+        """
+        self._listeners.append(listener)
+
+    def add_tick_end(self, callback):
+        """Register callback(), run after all animations of every tick (e.g. to flush UI updates)"""
+        self._tick_end.append(callback)
+
+    def _tick(self):
+        now = time.perf_counter()
+
+        self.in_tick = True
+        for handle, (callback, start) in list(self._animations.items()):
+            if handle not in self._animations: continue # Removed by another callback
+            try:
+                keep = callback(now - start)
+            except Exception as e:
+                print(f"Animation error: {e}")
+                keep = False
+            if keep is False:
+                self._animations.pop(handle, None)
+        self.in_tick = False
+
+        for callback in self._tick_end:
+            callback()
+
+        if self._last_tick is not None:
+            for listener in self._listeners:
+                listener(now - self._last_tick)
+        self._last_tick = now
+
+        if not self._animations:
+            self._running = False
+            return
+
+        # Next slot on the fixed frame grid (missed slots are skipped)
+        after = time.perf_counter()
+        frames = int((after - self._origin) / self.frame_time) + 1
+        delay = self._origin + frames * self.frame_time - after
+        self.root.after(max(1, int(delay * 1000)), self._tick)
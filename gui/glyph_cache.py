@@ -0,0 +1,147 @@
+import os
+import queue
+import threading
+import tkinter
+import customtkinter as ctk
+from config import MIN_NUMBER, MAX_NUMBER
+from gui.fonts import find_truetype
+
+try:
+    from PIL import Image, ImageDraw, ImageFont, ImageTk
+except ImportError:
+    Image = None # Label keeps rendering text
+
+FONT_CANDIDATES = (
+    "Roboto-Bold.ttf",
+    os.path.join(os.path.dirname(ctk.__file__), "assets", "fonts", "Roboto", "Roboto-Medium.ttf"),
+    "arialbd.ttf", "DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf"
+)
+GLYPH_CHARS = "0123456789-"
+CONVERT_CHUNK = 4 # Glyph PhotoImages created per idle callback
+
+class NumberGlyphCache:
+    """
+    Image-based rendering of the big number label.
+    - Pillow renders one small glyph per character ("0"-"9", "-") in the text
+      and the impact accent color, cropped to a shared ink band, in a background
+      thread. The Tk thread turns them into PhotoImages in small idle chunks.
+    - A label text is then composed into one fixed-size display PhotoImage with
+      Tk's native photo copy: no text layout, no Pillow work during a spin, and
+      the label keeps its size for every number.
+    - The cache key is (colors, font size, widget scaling): a theme change or a
+      DPI rescale triggers a lazy rebuild on the next lookup. The previous set
+      is served until the new one is ready, so an image label never has to go
+      back to text.
+    Disabled without Pillow or without a usable font.
+    """
+    POLL_MS = 50
+
+    def __init__(self, widget, font_size, on_ready=None):
+        """
+        :param widget: widget whose scaling is used (the number label's parent)
+        :param on_ready: called on the Tk thread once a glyph set is available
+        """
+        self.widget = widget
+        self.font_size = font_size
+        self.on_ready = on_ready
+        # Widest label text of the range ("--" included)
+        self.max_chars = max(2, len(str(MIN_NUMBER)), len(str(MAX_NUMBER)))
+        self.font_path = find_truetype(FONT_CANDIDATES) if Image is not None else None
+        self.enabled = self.font_path is not None
+
+        self._key = None      # Key of the set being built or shown
+        self._glyphs = {}     # (char, accent) -> PhotoImage of the newest finished set
+        self._display = None  # PhotoImage shown by the label (recomposed in place)
+        self._results = queue.Queue()
+        self._jobs = 0        # Builds not yet collected
+
+    def get(self, text, colors, accent=False):
+        """
+        Display image showing text, or None.
+        :param colors: (text color, accent color) of the current theme
+        :param accent: use the accent color instead of the text color
+        """
+        if not self.enabled: return None
+        scaling = ctk.ScalingTracker.get_widget_scaling(self.widget)
+        key = (colors, self.font_size, scaling)
+        if key != self._key:
+            self._build(key)
+
+        if self._display is None: return None
+        glyphs = [self._glyphs.get((ch, accent)) for ch in text]
+        if None in glyphs: return None
+
+        # Center the glyph run in the fixed-size display image
+        display = self._display
+        x = (display.width() - sum(g.width() for g in glyphs)) // 2
+        display.blank()
+        for glyph in glyphs:
+            display.tk.call(display, "copy", glyph, "-to", x, 0)
+            x += glyph.width()
+        return display
+
+    def _build(self, key):
+        self._key = key
+        colors, font_size, scaling = key
+
+        def job():
+            try:
+                images = self._render(colors, int(font_size * scaling))
+            except Exception as e:
+                print(f"Glyph render error: {e}")
+                images = {}
+            self._results.put((key, images))
+
+        self._jobs += 1
+        if self._jobs == 1:
+            self.widget.after(self.POLL_MS, self._poll)
+        threading.Thread(target=job, name="GlyphRender", daemon=True).start()
+
+    def _poll(self):
+        while True:
+            try:
+                key, images = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._jobs -= 1
+            if key != self._key or not images: continue # Superseded or failed
+            self._convert(key, list(images.items()), {})
+
+        if self._jobs > 0:
+            self.widget.after(self.POLL_MS, self._poll)
+
+    def _convert(self, key, pending, glyphs):
+        """Create the PhotoImages a few at a time so no frame is held up"""
+        if key != self._key: return # A newer build took over
+        for _ in range(min(CONVERT_CHUNK, len(pending))):
+            k, image = pending.pop()
+            glyphs[k] = ImageTk.PhotoImage(image, master=self.widget)
+        if pending:
+            self.widget.after_idle(self._convert, key, pending, glyphs)
+            return
+
+        # Set complete: the widest character decides the display width
+        width = self.max_chars * max(g.width() for g in glyphs.values())
+        height = max(g.height() for g in glyphs.values())
+        self._glyphs = glyphs
+        self._display = tkinter.PhotoImage(master=self.widget, width=width, height=height)
+        if self.on_ready:
+            self.on_ready()
+
+    def _render(self, colors, pixel_size):
+        """Worker thread: {(char, accent): small RGBA glyph} on a shared ink band"""
+        font = ImageFont.truetype(self.font_path, pixel_size)
+        boxes = {ch: font.getbbox(ch) for ch in GLYPH_CHARS}
+        top = min(b[1] for b in boxes.values())
+        bottom = max(b[3] for b in boxes.values())
+
+        images = {}
+        for ch, (left, _, right, _) in boxes.items():
+            width = max(1, int(max(font.getlength(ch), right) + 0.5))
+            mask = Image.new("L", (width, bottom - top), 0)
+            ImageDraw.Draw(mask).text((0, -top), ch, font=font, fill=255)
+            for accent, color in enumerate(colors):
+                image = Image.new("RGBA", mask.size, color)
+                image.putalpha(mask)
+                images[(ch, bool(accent))] = image
+        return images
@@ -0,0 +1,82 @@
+import customtkinter as ctk
+from gui.canvas_items import CanvasItemPool
+
+class EffectOverlay:
+    """
+    Long-lived transparent, topmost window shared by all effects.
+    - The window and its canvas are built once (prepare()) and then only
+      shown / hidden, so starting an effect no longer creates a Toplevel.
+    - While visible it follows the root window (move / resize / fullscreen).
+    - Canvas item pools live here too, so items are reused across effects.
+    """
+    TRANS_COLOR = "#000001"
+
+    def __init__(self, root):
+        self.root = root
+        self.window = None
+        self.canvas = None
+        self.visible = False
+        self._pools = {} # name -> CanvasItemPool
+
+        self.root.bind("<Configure>", self._on_root_configure, add="+")
+
+    def prepare(self):
+        """Build the (hidden) window now. Safe to call more than once."""
+        if self.window is not None: return
+
+        self.window = ctk.CTkToplevel(self.root)
+        self.window.withdraw()
+        self.window.overrideredirect(True)
+
+        self.window.configure(fg_color=self.TRANS_COLOR)
+        self.window.attributes("-transparentcolor", self.TRANS_COLOR)
+        self.window.attributes("-topmost", True)
+
+        self.canvas = ctk.CTkCanvas(self.window, bg=self.TRANS_COLOR, highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
+
+    def acquire(self):
+        """Show the overlay over the root window and return its canvas"""
+        self.prepare()
+        self._sync_geometry()
+        if not self.visible:
+            self.window.deiconify()
+            self.window.lift()
+            self.visible = True
+        return self.canvas
+
+    def release(self):
+        """Hide the overlay; items stay allocated for the next effect"""
+        for pool in self._pools.values():
+            pool.hide_all()
+        if self.window is not None and self.visible:
+            self.window.withdraw()
+        self.visible = False
+
+    def pool(self, name, kind, **defaults):
+        """Shared CanvasItemPool for one effect layer (created on first use)"""
+        pool = self._pools.get(name)
+        if pool is None:
+            self.prepare()
+            pool = self._pools[name] = CanvasItemPool(self.canvas, kind, "fx_" + name, **defaults)
+        return pool
+
+    def _sync_geometry(self):
+        x = self.root.winfo_rootx()
+        y = self.root.winfo_rooty()
+        w = self.root.winfo_width()
+        h = self.root.winfo_height()
+        self.window.geometry(f"{w}x{h}+{x}+{y}")
+        self.canvas.configure(width=w, height=h)
+
+    def follow_root(self):
+        """Re-align with the root window (e.g. after a fullscreen toggle)"""
+        if not self.visible: return
+        self._sync_geometry()
+        self.window.lift()
+
+    def _on_root_configure(self, event):
+        # Bound on the root, so child widget events arrive here too
+        if event.widget is not self.root: return
+        if self.visible:
+            self._sync_geometry()
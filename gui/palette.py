@@ -0,0 +1,30 @@
+from functools import lru_cache
+
+TRAIL_FADE_STEPS = 6 # Trail intensities 1..5 fade toward the cell background
+
+def hex_to_rgb(color):
+    color = color.lstrip("#")
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+def rgb_to_hex(rgb):
+    return "#{:02x}{:02x}{:02x}".format(*rgb)
+
+def blend(color_a, color_b, t):
+    """Color t of the way from color_a (t=0) to color_b (t=1)"""
+    a = hex_to_rgb(color_a)
+    b = hex_to_rgb(color_b)
+    return rgb_to_hex(tuple(round(x + (y - x) * t) for x, y in zip(a, b)))
+
+@lru_cache(maxsize=None)
+def fade_palette(color, background, steps=TRAIL_FADE_STEPS):
+    """
+    steps colors from color (index 0) toward background.
+    The last step stays short of the background so it remains visible.
+    Built once per (color, background), i.e. once per theme.
+    """
+    return tuple(blend(color, background, i / steps) for i in range(steps))
+
+def trail_color(colors, intensity):
+    """Trail cell color for intensity (0 = head) in a theme's COLORS dict"""
+    palette = fade_palette(colors["accent_cursor"], colors["cell_bg"])
+    return palette[min(intensity, len(palette) - 1)]
@@ -1,5 +1,8 @@
+import warnings
 import customtkinter as ctk
-from config import COLORS, MIN_NUMBER, MAX_NUMBER
+from config import COLORS, MAX_NUMBER, GRID_COLUMNS
+from gui.palette import trail_color
+from gui.glyph_cache import NumberGlyphCache
 
 class PanelBase(ctk.CTkFrame):
     def __init__(self, master, **kwargs):
@@ -33,13 +36,20 @@ class LeftPanel(PanelBase):
         self.grid_columnconfigure(0, weight=1)
 
         # 1. Current Number Display
+        # 400pt fits two digits; shrink for raffle-sized numbers
+        number_font_size = 400 * 2 // max(2, len(str(MAX_NUMBER)))
         self.lbl_number = ctk.CTkLabel(
             self, 
             text="--",
-            font=("Roboto", 400, "bold"),
+            font=("Roboto", number_font_size, "bold"),
             text_color=self._colors["text"]
         )
         self.lbl_number.grid(row=1, column=0, pady=(0, 40))
+        self._number_text = "--"
+        self._number_accent = False # Impact highlight (accent color) active
+        self._number_image = None   # Glyph shown instead of text, if any
+        # Pre-rendered label images, swapped in instead of re-laying out 400pt text
+        self.glyphs = NumberGlyphCache(self, number_font_size, on_ready=self._show_number)
 
         # 2. SPIN Button
         self.btn_spin = ctk.CTkButton(
@@ -116,6 +126,8 @@ class LeftPanel(PanelBase):
         super()._apply_theme()
         if hasattr(self, 'lbl_number'):
             self.lbl_number.configure(text_color=self._colors["text"])
+            self._number_accent = False
+            self._show_number() # Glyphs of the new theme are built lazily
         if hasattr(self, 'btn_spin'):
             self.btn_spin.configure(
                 fg_color=self._colors["btn_spin"],
@@ -127,7 +139,30 @@ class LeftPanel(PanelBase):
         
     def update_number(self, num):
         text = str(num) if num is not None else "--"
-        self.lbl_number.configure(text=text)
+        if text == self._number_text: return # Re-layout of the big label is costly
+        self._number_text = text
+        self._show_number()
+
+    def set_number_accent(self, accent):
+        """Show the number in accent_cursor (impact) or the normal text color"""
+        self._number_accent = accent
+        color = self._colors["accent_cursor"] if accent else self._colors["text"]
+        self.lbl_number.configure(text_color=color)
+        self._show_number()
+
+    def _show_number(self):
+        colors = (self._colors["text"], self._colors["accent_cursor"])
+        image = self.glyphs.get(self._number_text, colors, self._number_accent)
+        if image is not None:
+            if image is not self._number_image:
+                # Glyphs are rendered at the widget scaling already, so a plain
+                # PhotoImage is right here; silence CTk's warning for this call only
+                with warnings.catch_warnings():
+                    warnings.filterwarnings("ignore", message=".*Given image is not CTkImage.*")
+                    self.lbl_number.configure(image=image, text="")
+                self._number_image = image
+        elif self._number_image is None:
+            self.lbl_number.configure(text=self._number_text)
 
     def set_spin_enabled(self, enabled):
         state = "normal" if enabled else "disabled"
@@ -160,42 +195,62 @@ class LeftPanel(PanelBase):
 
 
 class RightPanel(PanelBase):
-    def __init__(self, master, **kwargs):
+    def __init__(self, master, board, batch=None, **kwargs):
+        """
+        :param board: BoardModel (drawn state + number -> cell mapping)
+        :param batch: RenderBatch; cell styles set during a clock tick are applied once at its end
+        """
         super().__init__(master, **kwargs)
         
-        self.grid_cells = {}
+        self.board = board
+        self.batch = batch
+        self.grid_cells = {} # cell index -> widgets (or canvas items)
+        # Last style pushed to each cell, so unchanged cells skip configure()
+        # cell index -> {"frame": (bg, border_width, border_color), "fg": fg, "text": text}
+        self._rendered = {}
         self._create_grid()
 
     def _create_grid(self):
-        # 10 lines x 8 rows (approx for 75)
-        # Spec: 10 columns
-        columns = 10
+        # Spec: 10 columns (8 rows for 75)
+        # In raffle mode each cell shows a block of numbers instead of one number
+        columns = GRID_COLUMNS
+        rows = -(-self.board.cell_count // columns)
         
-        for num in range(MIN_NUMBER, MAX_NUMBER + 1):
-            row = (num - 1) // columns
-            col = (num - 1) % columns
+        for cell in range(self.board.cell_count):
+            row = cell // columns
+            col = cell % columns
             
             # Cell Frame
             frame = ctk.CTkFrame(self, corner_radius=5)
             frame.grid(row=row, column=col, padx=4, pady=4, sticky="nsew")
             
             # Label
+            if self.board.is_raffle:
+                font = ("Arial", 12, "bold")
+            else:
+                font = ("Arial", 70, "bold")
             label = ctk.CTkLabel(
                 frame, 
-                text=str(num),
-                font=("Arial", 70, "bold")
+                text=self._cell_text(cell),
+                font=font
             )
             label.place(relx=0.5, rely=0.5, anchor="center")
             
-            self.grid_cells[num] = {"frame": frame, "label": label}
+            self.grid_cells[cell] = {"frame": frame, "label": label}
             
         # Configure grid weights
         for i in range(columns):
             self.grid_columnconfigure(i, weight=1)
         # Rows
-        for i in range(8):
+        for i in range(rows):
             self.grid_rowconfigure(i, weight=1)
 
+    def _cell_text(self, cell):
+        r = self.board.cell_range(cell)
+        if not self.board.is_raffle:
+            return str(r.start)
+        return f"{r.start}-{r[-1]}\n{self.board.cell_drawn(cell)}/{len(r)}"
+
     def _apply_theme(self):
         super()._apply_theme()
         # Reset all cells to "normal" for the new theme
@@ -208,33 +263,16 @@ class RightPanel(PanelBase):
         """
         state: 'normal', 'hit'
         is_cursor: bool (overrides state)
-        trail_intensity: int (0=Head/None, 1=Strong, 2=Med, 3=Weak)
+        trail_intensity: int (0=Head/None, 1=Strong ... TRAIL_FADE_STEPS-1=Weak)
         """
-        if num not in self.grid_cells: return
-        
-        widgets = self.grid_cells[num]
-        frame = widgets["frame"]
-        label = widgets["label"]
+        cell = self.board.cell_of(num)
+        if cell is None: return
         
         # Colors
-        cursor_color = self._colors["accent_cursor"] # e.g. #00ffff or similar logic
+        cursor_color = self._colors["accent_cursor"]
         hit_color = self._colors["accent_hit"]
         normal_bg = self._colors["cell_bg"]
         
-        # Pre-calculated gradients for 'cyan'/'orange' themes roughly
-        # Since we use 'accent_cursor' from logic, we might not know specific hex.
-        # But for 'dark' theme accent_cursor is likely Cyan-ish.
-        # Let's try to act smart: if cursor color is Hex, we can't easily dim it without lib.
-        # However, we only have 2 themes. We can just check self._colors["accent_cursor"] and map manually?
-        # Or simpler: Just hardcode nice "Fade" colors for Dark/Light mode in panels.
-        
-        # We need to know current theme to pick gradients? 
-        # self._colors is populated by update_theme.
-        # Let's check typical values: 
-        # Dark Cursor: #4cc9f0 (Cyan)
-        # Light Cursor: #eebb00 (Orange)? checking config...
-        # Let's assume standard colors for now.
-        
         bg = normal_bg
         fg = self._colors["text_dim"]
         border_width = 0
@@ -248,55 +286,46 @@ class RightPanel(PanelBase):
                 border_width = 2
                 border_color = "#ffffff"
             else:
-                # TRAIL (Faded)
-                # Use cursor_color for all, but remove border.
-                # Since we can't easily fade HEX without lib, we stick to solid cursor color
-                # But maybe we can distinct based on intensity? 
-                # User wants "Orange" (Single Color) fade.
-                # If we use the exact same color, it looks like a block.
-                # We need a way to show "Fading".
-                # If we are Light Mode (Orange), let's use predetermined lighter oranges?
-                # Or just use the Hit Color (which is usually diff) as tail?
-                # User said "Fade is single color (Orange)".
-                
-                # Let's check if we are in Light Mode (Orange Cursor)
-                # Config has: Light -> Accent Cursor = #FF9800 (Orange)
-                # Dark -> Accent Cursor = #00E5FF (Cyan)
-                
-                bg = cursor_color
+                # TRAIL (Faded toward the cell background, cached per theme)
+                bg = trail_color(self._colors, trail_intensity)
                 border_width = 0
-                
-                # Manual Gradient Hack for known colors
-                # Light Mode (Orange #FF9800)
-                if "FF9800" in cursor_color.upper() or "ORANGE" in cursor_color.upper():
-                    # Fade to Yellow/White?
-                    if trail_intensity == 1: bg = "#FFB74D" # Lighter Orange
-                    elif trail_intensity == 2: bg = "#FFCC80"
-                    elif trail_intensity == 3: bg = "#FFE0B2"
-                    
-                # Dark Mode (Cyan #00E5FF)
-                elif "00E5FF" in cursor_color.upper() or "CYAN" in cursor_color.upper() or "4CC9F0" in cursor_color.upper(): 
-                     if trail_intensity == 1: bg = "#26C6DA"
-                     elif trail_intensity == 2: bg = "#4DD0E1"
-                     elif trail_intensity == 3: bg = "#80DEEA"
-                
-                # If unknown color, keep solid (better than wrong color)
-
 
         elif state == "hit":
             bg = hit_color
             fg = "#ffffff"
             
-        frame.configure(fg_color=bg, border_width=border_width, border_color=border_color)
-        label.configure(text_color=fg)
+        if self.batch:
+            # Last state set for the cell in this tick wins
+            self.batch.put(("cell", cell), self._render_style, cell, bg, fg, border_width, border_color)
+        else:
+            self._render_style(cell, bg, fg, border_width, border_color)
 
+    # --- Rendering backend (overridden by CanvasRightPanel) ---
+    def _render_style(self, cell, bg, fg, border_width, border_color):
+        widgets = self.grid_cells[cell]
+        
+        # Only touch widgets whose style actually changed
+        rendered = self._rendered.setdefault(cell, {})
+        frame_style = (bg, border_width, border_color)
+        if rendered.get("frame") != frame_style:
+            widgets["frame"].configure(fg_color=bg, border_width=border_width, border_color=border_color)
+            rendered["frame"] = frame_style
+        if rendered.get("fg") != fg:
+            widgets["label"].configure(text_color=fg)
+            rendered["fg"] = fg
 
+    def _render_text(self, cell, text):
+        rendered = self._rendered.setdefault(cell, {})
+        if rendered.get("text") != text:
+            self.grid_cells[cell]["label"].configure(text=text)
+            rendered["text"] = text
 
     def get_cell_bbox(self, num):
         """Returns (x, y, width, height) of the cell relative to the SCREEN (or at least root window)"""
-        if num not in self.grid_cells: return None
+        cell = self.board.cell_of(num)
+        if cell is None: return None
         
-        frame = self.grid_cells[num]["frame"]
+        frame = self.grid_cells[cell]["frame"]
         
         # We need coordinates relative to the root window to place a floating label
         try:
@@ -309,8 +338,28 @@ class RightPanel(PanelBase):
             return None
 
 
+    def restore_cell(self, num, pending=None):
+        """
+        Revert a cell to its normal/hit state based on the board.
+        pending: number already drawn in logic but not yet revealed (shown as not hit).
+        """
+        cell = self.board.cell_of(num)
+        if cell is None: return
+        
+        drawn = self.board.cell_drawn(cell)
+        if pending is not None and self.board.cell_of(pending) == cell and self.board.is_drawn(pending):
+            drawn -= 1
+            
+        state = "hit" if drawn > 0 else "normal"
+        self.update_cell_state(num, state, is_cursor=False)
+
     def refresh_all(self, history, current_cursor=None):
-        for num in range(MIN_NUMBER, MAX_NUMBER + 1):
-            state = "hit" if num in history else "normal"
-            is_cursor = (num == current_cursor)
+        """history is kept for interface compatibility; drawn state comes from the board"""
+        cursor_cell = self.board.cell_of(current_cursor) if current_cursor is not None else None
+        for cell in range(self.board.cell_count):
+            num = self.board.cell_range(cell).start
+            state = "hit" if self.board.cell_drawn(cell) > 0 else "normal"
+            is_cursor = (cell == cursor_cell)
+            if self.board.is_raffle:
+                self._render_text(cell, self._cell_text(cell))
             self.update_cell_state(num, state, is_cursor)
@@ -0,0 +1,162 @@
+import math
+import random
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None # Same storage layout, updated with a plain loop
+
+# Particle kinds
+CIRCLE = 0
+LINE = 1
+
+class ParticlePool:
+    """
+    Struct-of-arrays particle storage.
+    Every attribute (x, y, vx, vy, life, ...) is one contiguous array indexed by
+    slot, live particles occupy slots [0, count).
+    step() advances all particles with one vectorized update (NumPy when available)
+    and compacts dead particles in bulk instead of rebuilding object lists.
+    """
+    FLOAT_FIELDS = ("x", "y", "vx", "vy", "life", "decay", "size", "drag", "gravity")
+    INT_FIELDS = ("kind", "color")
+
+    def __init__(self, capacity=256):
+        self.count = 0
+        self.palette = []       # color index -> color string
+        self._palette_idx = {}  # color string -> color index
+        self._capacity = 0
+        self._grow(capacity)
+
+    # --- Storage ---
+    def _new_array(self, size, is_float):
+        if np is not None:
+            return np.zeros(size, dtype=np.float64 if is_float else np.int32)
+        return array('d', [0.0]) * size if is_float else array('l', [0]) * size
+
+    def _grow(self, capacity):
+        for name in self.FLOAT_FIELDS + self.INT_FIELDS:
+            new = self._new_array(capacity, name in self.FLOAT_FIELDS)
+            old = getattr(self, name, None)
+            if old is not None:
+                new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self._capacity = capacity
+
+    def _color_index(self, color):
+        idx = self._palette_idx.get(color)
+        if idx is None:
+            idx = self._palette_idx[color] = len(self.palette)
+            self.palette.append(color)
+        return idx
+
+    def clear(self):
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    # --- Emission ---
+    def emit(self, n, x, y, kind, colors, speed, size, drag, gravity,
+             life=1.0, decay=(0.01, 0.03), speed_scale=1.0):
+        """
+        Spawn n particles at (x, y) flying in random directions.
+        colors: list of color strings (picked uniformly per particle)
+        speed / size / decay: (min, max) uniform ranges
+        """
+        if n <= 0: return
+        if self.count + n > self._capacity:
+            self._grow(max(self._capacity * 2, self.count + n))
+
+        a, b = self.count, self.count + n
+        color_ids = [self._color_index(c) for c in colors]
+
+        if np is not None:
+            angle = np.random.uniform(0, 2 * math.pi, n)
+            spd = np.random.uniform(speed[0], speed[1], n) * speed_scale
+            self.vx[a:b] = np.cos(angle) * spd
+            self.vy[a:b] = np.sin(angle) * spd
+            self.size[a:b] = np.random.uniform(size[0], size[1], n)
+            self.decay[a:b] = np.random.uniform(decay[0], decay[1], n)
+            self.color[a:b] = np.asarray(color_ids)[np.random.randint(0, len(color_ids), n)]
+        else:
+            for i in range(a, b):
+                angle = random.uniform(0, 2 * math.pi)
+                spd = random.uniform(speed[0], speed[1]) * speed_scale
+                self.vx[i] = math.cos(angle) * spd
+                self.vy[i] = math.sin(angle) * spd
+                self.size[i] = random.uniform(size[0], size[1])
+                self.decay[i] = random.uniform(decay[0], decay[1])
+                self.color[i] = random.choice(color_ids)
+
+        self.x[a:b] = self._fill(x, n)
+        self.y[a:b] = self._fill(y, n)
+        self.life[a:b] = self._fill(life, n)
+        self.drag[a:b] = self._fill(drag, n)
+        self.gravity[a:b] = self._fill(gravity, n)
+        self.kind[a:b] = self._fill(kind, n, is_float=False)
+        self.count = b
+
+    def _fill(self, value, n, is_float=True):
+        if np is not None:
+            return value
+        return array('d' if is_float else 'l', [value] * n)
+
+    # --- Physics ---
+    def step(self):
+        """Advance every live particle one physics step, then drop dead ones."""
+        n = self.count
+        if n == 0: return
+
+        if np is not None:
+            x, y = self.x[:n], self.y[:n]
+            vx, vy = self.vx[:n], self.vy[:n]
+            drag = self.drag[:n]
+            x += vx
+            y += vy
+            vy += self.gravity[:n]
+            vx *= drag
+            vy *= drag
+            self.life[:n] -= self.decay[:n]
+
+            alive = self.life[:n] > 0
+            k = int(np.count_nonzero(alive))
+            if k < n:
+                # Bulk compaction: surviving slots move to the front
+                for name in self.FLOAT_FIELDS + self.INT_FIELDS:
+                    arr = getattr(self, name)
+                    arr[:k] = arr[:n][alive]
+            self.count = k
+            return
+
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        life, decay, drag, gravity = self.life, self.decay, self.drag, self.gravity
+        fields = [getattr(self, name) for name in self.FLOAT_FIELDS + self.INT_FIELDS]
+        k = 0
+        for i in range(n):
+            x[i] += vx[i]
+            y[i] += vy[i]
+            vy[i] += gravity[i]
+            vx[i] *= drag[i]
+            vy[i] *= drag[i]
+            life[i] -= decay[i]
+            if life[i] > 0:
+                if k != i:
+                    for arr in fields:
+                        arr[k] = arr[i]
+                k += 1
+        self.count = k
+
+    # --- Drawing access ---
+    def rows(self):
+        """Live particles as (x, y, vx, vy, life, size, kind, color) tuples for drawing."""
+        n = self.count
+        cols = [self.x, self.y, self.vx, self.vy, self.life, self.size, self.kind]
+        if np is not None:
+            cols = [c[:n].tolist() for c in cols]
+        else:
+            cols = [c[:n] for c in cols]
+        palette = self.palette
+        colors = [palette[c] for c in self.color[:n]]
+        return zip(*cols, colors)
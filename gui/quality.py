@@ -0,0 +1,93 @@
+from config import EFFECT_QUALITY_DEFAULT, EFFECT_QUALITY_AUTO
+
+# Effect settings per tier (FlyingNumberEffect reads these)
+# particles: multiplier on explosion circles / lines
+# trail:     trail particles spawned per flight step
+# flash:     flash radius in px
+# duration:  multiplier on explosion lifetime (particles, shockwaves, flash)
+QUALITY_TIERS = {
+    "ultra": {"particles": 1.5, "trail": 8, "flash": 360, "duration": 1.2},
+    "high":  {"particles": 1.0, "trail": 5, "flash": 300, "duration": 1.0},
+    "low":   {"particles": 0.4, "trail": 2, "flash": 200, "duration": 0.7},
+    "off":   None, # No flying number / explosion at all
+}
+AUTO_TIERS = ("off", "low", "high", "ultra") # Range the governor moves in, lowest first
+
+class QualityGovernor:
+    """
+    Picks the effect quality tier from measured frame times.
+    - Frame times come from the FrameClock, i.e. from the spin and the effects.
+    - After each draw (evaluate()) a slow run drops one tier at once; several
+      smooth runs in a row raise it by one.
+    - "low" -> "off" needs several slow runs in a row. Once the governor turned
+      effects off, it does not turn them back on in the same session: at "off"
+      only the spin is measured, which says little about the effects.
+    - The tier is persisted through DataManager, so the next start begins there.
+    """
+    SETTING_KEY = "effect_quality"
+    SLOW_FACTOR = 1.8     # 90th percentile frame > 1.8 frames -> step down
+    SMOOTH_FACTOR = 1.15  # 90th percentile frame < 1.15 frames counts as smooth
+    SMOOTH_RUNS_TO_RAISE = 3
+    SLOW_RUNS_TO_OFF = 3
+    MIN_SAMPLES = 30
+
+    def __init__(self, data_manager, clock, tier=None, auto=EFFECT_QUALITY_AUTO):
+        """
+        :param tier: saved tier (None or unknown -> EFFECT_QUALITY_DEFAULT)
+        """
+        self.dm = data_manager
+        self.frame_time = clock.frame_time
+        self.auto = auto
+        self.tier = tier if tier in QUALITY_TIERS else EFFECT_QUALITY_DEFAULT
+
+        self._samples = []
+        self._smooth_runs = 0
+        self._slow_runs = 0
+        self._turned_off = False # Effects were too slow at "low" this session
+        clock.add_listener(self._on_frame)
+
+    @property
+    def settings(self):
+        """Settings dict of the current tier, None when effects are off"""
+        return QUALITY_TIERS[self.tier]
+
+    def set_tier(self, tier):
+        if tier not in QUALITY_TIERS or tier == self.tier: return
+        self.tier = tier
+        self._smooth_runs = 0
+        self._slow_runs = 0
+        self.dm.save_setting(self.SETTING_KEY, tier)
+
+    def _on_frame(self, frame_seconds):
+        self._samples.append(frame_seconds)
+
+    def evaluate(self):
+        """Call once a draw (spin + effect) is over. May change the tier."""
+        samples, self._samples = self._samples, []
+        if not self.auto or self.tier not in AUTO_TIERS: return
+        if len(samples) < self.MIN_SAMPLES: return
+
+        samples.sort()
+        p90 = samples[int(len(samples) * 0.9)]
+        level = AUTO_TIERS.index(self.tier)
+
+        if p90 > self.frame_time * self.SLOW_FACTOR:
+            self._smooth_runs = 0
+            self._slow_runs += 1
+            if level == 1 and self._slow_runs < self.SLOW_RUNS_TO_OFF: return
+            if level > 0:
+                self._turned_off = level == 1
+                self._step(level - 1, p90)
+        elif p90 < self.frame_time * self.SMOOTH_FACTOR:
+            self._slow_runs = 0
+            self._smooth_runs += 1
+            if level == 0 and self._turned_off: return
+            if self._smooth_runs >= self.SMOOTH_RUNS_TO_RAISE and level < len(AUTO_TIERS) - 1:
+                self._step(level + 1, p90)
+        else:
+            self._smooth_runs = 0
+            self._slow_runs = 0
+
+    def _step(self, level, p90):
+        print(f"Effect quality: {self.tier} -> {AUTO_TIERS[level]} (p90 frame {p90 * 1000:.1f}ms)")
+        self.set_tier(AUTO_TIERS[level])
@@ -0,0 +1,26 @@
+class RenderBatch:
+    """
+    Coalesces UI updates made during a FrameClock tick.
+    - Inside a tick, put(key, apply, *args) only remembers the latest call per
+      key (e.g. the number label, one grid cell); they all run once when the
+      tick ends, so each widget is configured at most once per frame.
+    - Outside a tick (button handlers, theme switch, ...) put applies at once.
+    """
+    def __init__(self, clock):
+        self.clock = clock
+        self._pending = {} # key -> (apply, args)
+        clock.add_tick_end(self.flush)
+
+    def put(self, key, apply, *args):
+        if not self.clock.in_tick:
+            apply(*args)
+            return
+        self._pending[key] = (apply, args)
+
+    def flush(self):
+        pending, self._pending = self._pending, {}
+        for apply, args in pending.values():
+            try:
+                apply(*args)
+            except Exception as e:
+                print(f"Render error: {e}")
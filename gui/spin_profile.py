@@ -0,0 +1,68 @@
+from array import array
+from functools import lru_cache
+from itertools import accumulate
+
+# Randomized parts of the spin (see SpinAnimation.start)
+P1_FRAMES_RANGE = (60, 125) # Constant-speed frames (1.0s - 2.0s at 16ms)
+CREEP_STEPS_RANGE = (2, 4)  # Numbers covered by the final creep
+
+class SpinProfile:
+    """
+    Precomputed velocity profile of one spin variant.
+    velocities[i]: wheel steps advanced in frame i
+    offsets[i]:    cumulative wheel offset after frame i (prefix sum of velocities)
+    """
+    def __init__(self, velocities):
+        self.velocities = array('d', velocities)
+        self.offsets = array('d', accumulate(velocities))
+        self.total_steps = int(self.offsets[-1])
+
+    def __len__(self):
+        return len(self.velocities)
+
+
+@lru_cache(maxsize=None)
+def get_spin_profile(p1_frames, creep_steps):
+    """Build (once) and return the SpinProfile for (p1_frames, creep_steps)"""
+    velocity_profile = []
+
+    # 1. P1: Speedster (Constant)
+    p1_v = 2.0
+    velocity_profile.extend([p1_v] * p1_frames)
+
+    # 2. P2: Main Deceleration
+    # V goes from 2.0 -> 0.05 (Very slow)
+    p2_frames = 100
+    p2_start_v = 2.0
+    p2_end_v = 0.05
+    for i in range(p2_frames):
+        t = i / p2_frames
+        # Quadratic Decay for smooth feel
+        v = (p2_start_v - p2_end_v) * ((1.0 - t)**2) + p2_end_v
+        velocity_profile.append(v)
+
+    # 3. P3: Creep / Tail (Randomized Length)
+    # V goes from 0.05 -> 0.0
+    # Calculate Duration T to cover 'creep_steps' starting from p2_end_v down to 0.
+    # Linear decay: Avg V = p2_end_v / 2.
+    # T = Steps / AvgV = 2 * Steps / p2_end_v.
+    p3_start_v = p2_end_v
+    p3_frames = int(2.0 * creep_steps / p3_start_v)
+
+    for i in range(p3_frames):
+        t = i / p3_frames
+        # Linear decay to 0
+        v = p3_start_v * (1.0 - t)
+        velocity_profile.append(v)
+
+    # Ensure hard stop at end
+    velocity_profile.append(0.0)
+
+    return SpinProfile(velocity_profile)
+
+
+def warm_spin_profiles():
+    """Precompute every variant (~200 small tables) so no spin builds one."""
+    for p1_frames in range(P1_FRAMES_RANGE[0], P1_FRAMES_RANGE[1] + 1):
+        for creep_steps in range(CREEP_STEPS_RANGE[0], CREEP_STEPS_RANGE[1] + 1):
+            get_spin_profile(p1_frames, creep_steps)
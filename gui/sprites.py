@@ -0,0 +1,140 @@
+import queue
+import threading
+from config import COLORS
+from gui.fonts import find_truetype
+
+try:
+    from PIL import Image, ImageDraw, ImageFont, ImageTk
+except ImportError:
+    Image = None # Effects keep drawing canvas primitives
+
+# Colors used by FlyingNumberEffect besides the theme accent
+EFFECT_COLORS = ["#FFD700", "#FFEC8B", "#FFFFFF", "#C0C0C0"]
+DISC_MAX_RADIUS = 12  # Largest particle radius (explosion size 4-12)
+NUMBER_FONT_SIZES = range(20, 61, 4) # Flying number grows 20 -> 60
+NUMBER_GLOW_RADIUS = 40
+FONT_CANDIDATES = ("arialbd.ttf", "Arial Bold.ttf", "DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf")
+
+def effect_colors(theme):
+    return [COLORS[theme]["accent_hit"]] + EFFECT_COLORS
+
+class SpriteAtlas:
+    """
+    Pre-rendered effect images (particle discs, glowing flying number).
+    - Pillow renders in a background thread; the Tk thread only converts the
+      finished images to PhotoImages (Tk objects must not be touched off-thread).
+    - Discs: every effect color x integer radius 1..DISC_MAX_RADIUS, per theme.
+    - Numbers: rendered per drawn number (prepare_number) at NUMBER_FONT_SIZES.
+    Sprites are drawn without anti-aliasing: the overlay's transparent color key
+    would otherwise leave dark fringes around soft edges.
+    Lookups return None until ready, callers then fall back to primitives.
+    """
+    POLL_MS = 50
+
+    def __init__(self, root):
+        self.root = root
+        self.available = Image is not None
+        self.theme = None
+        self._generation = 0 # Bumped on rebuild, stale results are dropped
+        self._discs = {}     # (color, radius) -> PhotoImage
+        self._numbers = {}   # (number, font_size) -> PhotoImage
+        self._results = queue.Queue()
+        self._jobs = 0       # Background renders not yet collected
+
+    # --- Requests (Tk thread) ---
+    def rebuild(self, theme):
+        """Drop all sprites and render the set for theme in the background"""
+        if not self.available: return
+        self.theme = theme
+        self._generation += 1
+        self._discs = {}
+        self._numbers = {}
+        self._start(self._render_discs, theme)
+
+    def prepare_number(self, number):
+        """Render the glowing number ahead of its flight (e.g. when the spin starts)"""
+        if not self.available or self.theme is None: return
+        if (number, NUMBER_FONT_SIZES[-1]) in self._numbers: return
+        self._start(self._render_number, self.theme, number)
+
+    def _start(self, render, *args):
+        generation = self._generation
+        def job():
+            try:
+                images = render(*args)
+            except Exception as e:
+                print(f"Sprite render error: {e}")
+                images = {}
+            self._results.put((generation, render, images))
+
+        self._jobs += 1
+        if self._jobs == 1:
+            self.root.after(self.POLL_MS, self._poll)
+        threading.Thread(target=job, name="SpriteRender", daemon=True).start()
+
+    def _poll(self):
+        while True:
+            try:
+                generation, render, images = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._jobs -= 1
+            if generation != self._generation: continue # Theme changed meanwhile
+
+            target = self._discs if render == self._render_discs else self._numbers
+            for key, image in images.items():
+                target[key] = ImageTk.PhotoImage(image, master=self.root)
+
+        if self._jobs > 0:
+            self.root.after(self.POLL_MS, self._poll)
+
+    # --- Lookups (Tk thread) ---
+    def disc(self, color, radius):
+        """Disc sprite closest to radius, or None"""
+        r = min(DISC_MAX_RADIUS, max(1, int(radius + 0.5)))
+        return self._discs.get((color, r))
+
+    def number(self, number, font_size):
+        """Glowing number sprite at the nearest prepared font size, or None"""
+        step = NUMBER_FONT_SIZES.step
+        i = min(len(NUMBER_FONT_SIZES) - 1, max(0, round((font_size - NUMBER_FONT_SIZES[0]) / step)))
+        return self._numbers.get((number, NUMBER_FONT_SIZES[i]))
+
+    # --- Rendering (worker thread, Pillow only) ---
+    def _render_discs(self, theme):
+        images = {}
+        for color in effect_colors(theme):
+            for r in range(1, DISC_MAX_RADIUS + 1):
+                d = 2 * r
+                image = Image.new("RGBA", (d, d), (0, 0, 0, 0))
+                ImageDraw.Draw(image).ellipse((0, 0, d - 1, d - 1), fill=color)
+                images[(color, r)] = image
+        return images
+
+    def _load_font(self, size):
+        path = find_truetype(FONT_CANDIDATES)
+        if path is None:
+            return None
+        return ImageFont.truetype(path, size)
+
+    def _render_number(self, theme, number):
+        images = {}
+        text = str(number)
+        glow = COLORS[theme]["accent_hit"]
+        for size in NUMBER_FONT_SIZES:
+            font = self._load_font(size)
+            if font is None:
+                return {} # No TrueType font: keep the canvas text item
+
+            left, top, right, bottom = font.getbbox(text)
+            side = max(2 * NUMBER_GLOW_RADIUS + 2, right - left + 4, bottom - top + 4)
+            image = Image.new("RGBA", (side, side), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(image)
+            draw.fontmode = "1" # No anti-aliasing (see class docstring)
+
+            c = side / 2
+            g = NUMBER_GLOW_RADIUS
+            draw.ellipse((c - g, c - g, c + g, c + g), outline=glow, width=2)
+            draw.text((c, c), text, font=font, fill="#FFFFFF", anchor="mm")
+            images[(number, size)] = image
+        return images
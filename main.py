@@ -22,7 +22,13 @@ def main():
     # app.mainloop()
     
     app = BingoApp(dm, logic, audio)
+    # Audio starts once the window is shown (mixer init + decoding in the worker);
+    # sounds requested before then are queued
+    app.after(100, audio.start)
     app.mainloop()
 
+    # 3. Make sure pending saves reach the disk before exit
+    dm.flush()
+
 if __name__ == "__main__":
     main()
@@ -1,31 +1,61 @@
 import os
+import queue
+import threading
 import pygame
-from config import SOUND_DIR
+from config import SOUND_DIR, SE_CHANNELS, SE_STEAL, SE_SHARED_CHANNELS
+from managers.channel_pool import ChannelPool
 
 class AudioManager:
+    """
+    Sound effects and BGM.
+    The public methods only enqueue commands; every pygame call runs on the
+    "AudioWorker" thread, so a slow mixer call never blocks a Tk frame.
+    Volume changes are coalesced: while one is queued, newer values just
+    replace it, so a slider drag costs one mixer update per worker pass.
+    Construction is cheap: the mixer is initialized and the sounds decoded by
+    the worker after start() (called once the window is up). Commands issued
+    before that wait in the queue and run once audio is ready.
+    """
     def __init__(self):
         self.bgm_enabled = True
         self.se_enabled = True
-        self.bgm_playing = False
-        
+        self.bgm_playing = False # Worker thread only
+        self.has_mixer = None # Unknown until the worker initialized the mixer
+
+        self.sounds = {}
+        self.bgm_path = None
+
+        # Command queue: (function, args), executed in order by the worker
+        self._commands = queue.Queue()
+        self._volume_lock = threading.Lock()
+        self._pending_volume = {} # "bgm" / "se" -> newest value not applied yet
+        self._worker = None
+
+    def start(self):
+        """Start the worker: mixer init + sound loading, then the queued commands"""
+        if self._worker is not None: return
+        self._worker = threading.Thread(target=self._audio_loop, name="AudioWorker", daemon=True)
+        self._worker.start()
+
+    def _init_mixer(self):
         # Avoid crash if no audio device
         try:
             pygame.mixer.init()
-            pygame.mixer.set_num_channels(32) # Allow many overlapping sounds
+            # Reserved channels per sound class ("decide" can't be starved by ticks)
+            self.channels = ChannelPool(SE_CHANNELS, steal=SE_STEAL, shared=SE_SHARED_CHANNELS)
             self.has_mixer = True
         except Exception as e:
             print(f"Audio init failed: {e}")
             self.has_mixer = False
 
-        self.sounds = {}
         self._load_sounds()
 
     def _load_sounds(self):
         if not self.has_mixer: return
-        
+
         # Define paths
         base_names = ["move", "decide"]
-        
+
         for name in base_names:
             # Try wav first, then mp3
             found = False
@@ -39,7 +69,7 @@ class AudioManager:
                         break # Loaded successfully
                     except:
                         print(f"Failed to load {filename}")
-            
+
             if not found:
                 print(f"SE not found for: {name} (checked .wav and .mp3)")
 
@@ -50,45 +80,36 @@ class AudioManager:
                 self.bgm_path = p
                 break
 
+    # --- Command API (any thread, non-blocking) ---
+    def _submit(self, func, *args):
+        if self.has_mixer is False: return # No audio device
+        self._commands.put((func, args))
+
     def play_bgm(self):
-        if not self.has_mixer or not self.bgm_enabled: return
-        if not self.bgm_path: return
-        
-        try:
-            if not self.bgm_playing:
-                pygame.mixer.music.load(self.bgm_path)
-                pygame.mixer.music.play(-1) # Loop
-                self.bgm_playing = True
-            else:
-                pygame.mixer.music.unpause()
-        except Exception as e:
-            print(f"BGM Error: {e}")
+        if not self.bgm_enabled: return
+        self._submit(self._play_bgm)
 
     def stop_bgm(self):
-        if not self.has_mixer: return
-        pygame.mixer.music.pause() # Pause instead of stop to resume smoothly if needed
+        self._submit(self._stop_bgm)
 
     def play_se(self, name, maxtime=0):
-        if not self.has_mixer or not self.se_enabled: return
-        sound = self.sounds.get(name)
-        if sound:
-            sound.play(maxtime=maxtime)
-            
+        if not self.se_enabled: return
+        self._submit(self._play_se, name, maxtime)
+
     def set_bgm_volume(self, val):
         """ val: 0.0 to 1.0 """
-        if not self.has_mixer: return
-        try:
-            pygame.mixer.music.set_volume(val)
-        except: pass
+        self._set_volume("bgm", val)
 
     def set_se_volume(self, val):
         """ val: 0.0 to 1.0 """
-        if not self.has_mixer: return
-        # Update all loaded sounds
-        for sound in self.sounds.values():
-            try:
-                sound.set_volume(val)
-            except: pass
+        self._set_volume("se", val)
+
+    def _set_volume(self, kind, val):
+        with self._volume_lock:
+            queued = kind in self._pending_volume
+            self._pending_volume[kind] = val
+        if not queued:
+            self._submit(self._apply_volume, kind)
 
     def toggle_bgm(self):
         self.bgm_enabled = not self.bgm_enabled
@@ -101,3 +122,51 @@ class AudioManager:
     def toggle_se(self):
         self.se_enabled = not self.se_enabled
         return self.se_enabled
+
+    # --- Worker thread ---
+    def _audio_loop(self):
+        self._init_mixer()
+
+        while True:
+            func, args = self._commands.get()
+            if not self.has_mixer: continue # Drain commands queued before init failed
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"Audio error: {e}")
+
+    def _play_bgm(self):
+        if not self.bgm_path: return
+
+        try:
+            if not self.bgm_playing:
+                pygame.mixer.music.load(self.bgm_path)
+                pygame.mixer.music.play(-1) # Loop
+                self.bgm_playing = True
+            else:
+                pygame.mixer.music.unpause()
+        except Exception as e:
+            print(f"BGM Error: {e}")
+
+    def _stop_bgm(self):
+        pygame.mixer.music.pause() # Pause instead of stop to resume smoothly if needed
+
+    def _play_se(self, name, maxtime):
+        sound = self.sounds.get(name)
+        if sound:
+            self.channels.play(name, sound, maxtime=maxtime)
+
+    def _apply_volume(self, kind):
+        with self._volume_lock:
+            val = self._pending_volume.pop(kind)
+
+        if kind == "bgm":
+            try:
+                pygame.mixer.music.set_volume(val)
+            except: pass
+        else:
+            # Update all loaded sounds
+            for sound in self.sounds.values():
+                try:
+                    sound.set_volume(val)
+                except: pass
@@ -0,0 +1,122 @@
+from config import MIN_NUMBER, MAX_NUMBER
+from managers.draw_pool import DrawPool, PoolUnion
+
+
+def ones_bucket(num):
+    # Last digit: 0-9
+    return num % 10
+
+def tens_bucket(num):
+    # 1-9 -> 0, 10-19 -> 1, ..., 70-75 -> 7
+    return num // 10
+
+def interval_bucket(num):
+    # 15-step intervals: 1-15 -> 0, 16-30 -> 1, ..., 61-75 -> 4
+    return (num - MIN_NUMBER) // 15
+
+
+def _ones_ranges(lo, hi):
+    ranges = {}
+    for digit in range(10):
+        first = lo + (digit - lo) % 10
+        if first <= hi:
+            ranges[digit] = range(first, hi + 1, 10)
+    return ranges
+
+def _block_ranges(lo, hi, bucket_fn, size, origin):
+    # Contiguous blocks of 'size' numbers aligned on 'origin'
+    ranges = {}
+    for b in range(bucket_fn(lo), bucket_fn(hi) + 1):
+        start = max(lo, origin + b * size)
+        end = min(hi, origin + b * size + size - 1)
+        ranges[b] = range(start, end + 1)
+    return ranges
+
+
+class BucketCounter:
+    """
+    Draw counts for one bucketing dimension (ones / tens / interval).
+    Buckets are also grouped by their count, so the gap (max - min) and the
+    lagging buckets are known without scanning history.
+    Keeps the still-available numbers of every bucket ready as a DrawPool.
+    """
+    def __init__(self, bucket_fn, bucket_ranges):
+        """
+        :param bucket_fn: number -> bucket key
+        :param bucket_ranges: bucket key -> range of numbers in that bucket
+        """
+        self.bucket_fn = bucket_fn
+        self.available = {b: DrawPool(r) for b, r in bucket_ranges.items()}
+        self.reset()
+
+    def reset(self):
+        self.counts = {b: 0 for b in self.available}
+        for pool in self.available.values():
+            pool.reset()
+
+        # count -> set of buckets having that count
+        self._by_count = {0: set(self.counts)}
+        self.min_count = 0
+        self.max_count = 0
+
+    def add(self, num):
+        b = self.bucket_fn(num)
+        if b not in self.counts: return # Out of configured range (old save data)
+
+        c = self.counts[b]
+        group = self._by_count[c]
+        group.discard(b)
+        if not group:
+            del self._by_count[c]
+
+        self.counts[b] = c + 1
+        self._by_count.setdefault(c + 1, set()).add(b)
+
+        # Counts only ever grow by one, so min moves at most one step
+        if c == self.min_count and c not in self._by_count:
+            self.min_count = c + 1
+        if c + 1 > self.max_count:
+            self.max_count = c + 1
+
+        self.available[b].discard(num)
+
+    @property
+    def gap(self):
+        return self.max_count - self.min_count
+
+    @property
+    def lagging(self):
+        """Buckets currently at the minimum count"""
+        return self._by_count.get(self.min_count, set())
+
+    def candidates(self, buckets):
+        """Available numbers belonging to any of the given buckets (a view, not a copy)"""
+        return PoolUnion(self.available[b] for b in buckets if b in self.available)
+
+
+class BiasStatistics:
+    """
+    Incremental distribution of the draw history used by the fairness bias.
+    Updated once per draw instead of re-scanning history on every SPIN.
+    """
+    def __init__(self, history=()):
+        lo, hi = MIN_NUMBER, MAX_NUMBER
+        self.ones = BucketCounter(ones_bucket, _ones_ranges(lo, hi))
+        self.tens = BucketCounter(tens_bucket, _block_ranges(lo, hi, tens_bucket, 10, 0))
+        self.interval = BucketCounter(interval_bucket, _block_ranges(lo, hi, interval_bucket, 15, lo))
+        self.dimensions = {
+            'ones': self.ones,
+            'tens': self.tens,
+            'interval': self.interval,
+        }
+
+        for num in history:
+            self.add(num)
+
+    def add(self, num):
+        for counter in self.dimensions.values():
+            counter.add(num)
+
+    def reset(self):
+        for counter in self.dimensions.values():
+            counter.reset()
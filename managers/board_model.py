@@ -0,0 +1,72 @@
+from array import array
+from config import MIN_NUMBER, MAX_NUMBER, GRID_MAX_CELLS, RAFFLE_THRESHOLD
+
+
+class BoardModel:
+    """
+    Compact drawn/undrawn state of the whole number range.
+    - Drawn flags are a bitmap (1 bit per number), so 100k tickets cost ~12 KB.
+    - In normal bingo (up to RAFFLE_THRESHOLD numbers, e.g. 1-75 or 1-90)
+      every display cell is one number; in raffle mode (larger ranges) the
+      numbers are grouped into at most GRID_MAX_CELLS cells of consecutive blocks.
+    """
+    def __init__(self, min_number=MIN_NUMBER, max_number=MAX_NUMBER, max_cells=GRID_MAX_CELLS,
+                 raffle_threshold=RAFFLE_THRESHOLD):
+        self.min_number = min_number
+        self.max_number = max_number
+        self.total = max_number - min_number + 1
+        self.is_raffle = self.total > raffle_threshold
+
+        # Numbers per cell (1 = one cell per number)
+        self.cell_size = -(-self.total // max_cells) if self.is_raffle else 1 # ceil
+        self.cell_count = -(-self.total // self.cell_size)
+
+        self.reset()
+
+    def reset(self):
+        self._bits = bytearray((self.total + 7) // 8)
+        self._cell_drawn = array('l', [0] * self.cell_count)
+        self.drawn_count = 0
+
+    def load(self, history):
+        self.reset()
+        for num in history:
+            self.mark(num)
+
+    def _index(self, num):
+        return num - self.min_number
+
+    def is_drawn(self, num):
+        i = self._index(num)
+        if not 0 <= i < self.total: return False
+        return bool(self._bits[i >> 3] & (1 << (i & 7)))
+
+    def mark(self, num):
+        i = self._index(num)
+        if not 0 <= i < self.total: return # Out of configured range (old save data)
+        mask = 1 << (i & 7)
+        if self._bits[i >> 3] & mask: return
+        self._bits[i >> 3] |= mask
+        self._cell_drawn[i // self.cell_size] += 1
+        self.drawn_count += 1
+
+    @property
+    def remaining(self):
+        return self.total - self.drawn_count
+
+    # --- Display cells ---
+    def cell_of(self, num):
+        """Display cell index for a number (None if out of range)"""
+        i = self._index(num)
+        if not 0 <= i < self.total: return None
+        return i // self.cell_size
+
+    def cell_range(self, cell):
+        """range of numbers shown by a cell"""
+        start = self.min_number + cell * self.cell_size
+        end = min(self.max_number, start + self.cell_size - 1)
+        return range(start, end + 1)
+
+    def cell_drawn(self, cell):
+        """How many numbers of the cell are drawn"""
+        return self._cell_drawn[cell]
@@ -0,0 +1,69 @@
+import time
+import pygame
+
+class ChannelPool:
+    """
+    Fixed mixer channels per sound class instead of pygame's "any free channel".
+    - Every class owns its own channels, so a flood of one class (spin ticks)
+      can never take the channel of another ("decide").
+    - When all channels of a class are busy, steal classes restart their
+      oldest voice; other classes drop the new sound.
+    - Classes not in the layout share the unreserved channels (pygame's own
+      pick via Sound.play()); they are counted under OTHER.
+    - stats counts played / stolen / dropped sounds per class.
+    Class channels are reserved, so Sound.play() auto-selection never touches them.
+    """
+    OTHER = "other"
+
+    def __init__(self, layout, steal=(), shared=2):
+        """
+        :param layout: {class name: channel count}
+        :param steal: classes that may cut their oldest voice
+        :param shared: extra unreserved channels for unlisted classes
+        """
+        total = sum(layout.values())
+        pygame.mixer.set_num_channels(total + shared)
+        pygame.mixer.set_reserved(total)
+
+        self.steal = set(steal)
+        self._channels = {} # class -> [Channel]
+        self._started = {}  # class -> [start time per channel]
+        self.stats = {}     # class -> {"played": n, "stolen": n, "dropped": n}
+
+        first = 0
+        for name, count in layout.items():
+            self._channels[name] = [pygame.mixer.Channel(i) for i in range(first, first + count)]
+            self._started[name] = [0.0] * count
+            self.stats[name] = {"played": 0, "stolen": 0, "dropped": 0}
+            first += count
+        self.stats[self.OTHER] = {"played": 0, "stolen": 0, "dropped": 0}
+
+    def play(self, name, sound, maxtime=0):
+        channels = self._channels.get(name)
+        if channels is None:
+            # Unlisted class: any free unreserved channel (None when all are busy)
+            stats = self.stats[self.OTHER]
+            if sound.play(maxtime=maxtime) is None:
+                stats["dropped"] += 1
+            else:
+                stats["played"] += 1
+            return
+
+        started = self._started[name]
+        stats = self.stats[name]
+        index = None
+        for i, channel in enumerate(channels):
+            if not channel.get_busy():
+                index = i
+                break
+
+        if index is None:
+            if name not in self.steal:
+                stats["dropped"] += 1
+                return
+            index = min(range(len(channels)), key=started.__getitem__)
+            stats["stolen"] += 1
+
+        channels[index].play(sound, maxtime=maxtime)
+        started[index] = time.monotonic()
+        stats["played"] += 1
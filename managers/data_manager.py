@@ -1,27 +1,131 @@
 import json
 import os
-import shutil
+import queue
+import threading
 import time
-from config import DATA_FILE, BACKUP_FILE
+from config import DATA_FILE, BACKUP_FILE, BACKUP_GENERATIONS, JOURNAL_FILE, JOURNAL_COMPACT_EVERY
 
 class DataManager:
+    """
+    Persistence = snapshot (DATA_FILE, with rotating backups) + append-only journal.
+    - Every draw / reset / settings change is one compact journal record
+      (one JSON line with a sequence number), so a SPIN writes a constant amount.
+    - Every JOURNAL_COMPACT_EVERY records the full state is written as a new
+      snapshot and the journal is truncated.
+    - load() = snapshot + replay of journal records newer than the snapshot.
+      A torn final record (crash mid-append) is ignored and cut off.
+    - Snapshots are written to a temp file and renamed over DATA_FILE, so the
+      main file is never half-written. BACKUP_FILE gets its own copy of the same
+      snapshot (the journal only reaches back to it); older generations rotate.
+    - A gap between the snapshot and the first replayed record (e.g. recovery
+      from an older generation) is reported instead of passing as a valid state.
+    """
     def __init__(self):
         self._ensure_data_dir()
 
+        # Authoritative in-memory state: read from disk once, kept current by
+        # every record, and only serialized by the writer.
+        self._state = None
+        self._lock = threading.Lock()
+        self._journal_records = 0 # Records appended since the last snapshot
+
+        # Background writer: records are applied to the cache immediately and
+        # queued; disk I/O happens off the Tk thread.
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, name="DataWriter", daemon=True)
+        self._writer.start()
+
     def _ensure_data_dir(self):
         os.makedirs(os.path.dirname(DATA_FILE), exist_ok=True)
 
     def load(self):
-        """Load bingo state. Tries main file, then backup, then returns default."""
+        """
+        Return a copy of the bingo state.
+        The first call reads disk (snapshot + journal); later calls use the cache.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            return self._copy_state()
+
+    def _ensure_loaded(self):
+        if self._state is not None: return
+        self._state = self._get_default_state()
+        self._state.update(self._load_snapshot())
+        self._replay_journal()
+
+    def _load_snapshot(self):
         try:
             return self._load_from_file(DATA_FILE)
-        except (FileNotFoundError, json.JSONDecodeError):
-            print("Main data file missing or corrupt. Trying backup...")
+        except FileNotFoundError:
+            # Snapshots are only written at compaction: until then the journal
+            # alone holds the state, which is not a loss worth reporting
+            if not os.path.exists(BACKUP_FILE) and os.path.exists(JOURNAL_FILE):
+                return self._get_default_state()
+            print("Main data file missing. Trying backup...")
+        except json.JSONDecodeError:
+            print("Main data file corrupt. Trying backup...")
+
+        # Rare path: saves are atomic, so this only happens after external damage
+        for gen in range(1, BACKUP_GENERATIONS + 1):
             try:
-                return self._load_from_file(BACKUP_FILE)
+                state = self._load_from_file(self._backup_path(gen))
             except (FileNotFoundError, json.JSONDecodeError):
-                print("Backup missing or corrupt. Starting fresh.")
-                return self._get_default_state()
+                continue
+            if gen > 1:
+                print(f"WARNING: using an older snapshot ({self._backup_path(gen)}), recent draws may be missing.")
+            return state
+        print("Backup missing or corrupt. Starting fresh.")
+        return self._get_default_state()
+
+    def _backup_path(self, gen):
+        if gen == 1: return BACKUP_FILE
+        base, ext = os.path.splitext(BACKUP_FILE)
+        return f"{base}.{gen}{ext}"
+
+    def _replay_journal(self):
+        try:
+            with open(JOURNAL_FILE, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+
+        valid_end = 0
+        pos = 0
+        expected = self._state["seq"] + 1 # First record the state is missing
+        while pos < len(data):
+            nl = data.find(b"\n", pos)
+            if nl == -1:
+                print("Journal: ignoring torn final record")
+                break
+            try:
+                record = json.loads(data[pos:nl])
+            except ValueError:
+                print("Journal: corrupt record, ignoring the rest")
+                break
+
+            # Records already contained in the snapshot are skipped
+            if record.get("seq", 0) > self._state["seq"]:
+                if expected is not None and record["seq"] != expected:
+                    print(f"WARNING: journal records {expected}-{record['seq'] - 1} are lost. "
+                          "History is incomplete, numbers drawn then may come up again.")
+                expected = None
+                self._apply_record(self._state, record)
+            self._journal_records += 1
+            pos = valid_end = nl + 1
+
+        # Cut off the damaged tail so new records start on a clean line
+        if valid_end < len(data):
+            try:
+                with open(JOURNAL_FILE, 'r+b') as f:
+                    f.truncate(valid_end)
+            except OSError as e:
+                print(f"Journal truncate failed: {e}")
+
+    def _copy_state(self):
+        # Callers own the returned history list (GameLogic appends to it)
+        state = dict(self._state)
+        state["history"] = list(state["history"])
+        return state
 
     def _load_from_file(self, filepath):
         with open(filepath, 'r') as f:
@@ -35,44 +139,151 @@ class DataManager:
             "current_number": None,
             "timestamp": time.time(),
             "volume_bgm": 1.0,
-            "volume_se": 1.0
+            "volume_se": 1.0,
+            "effect_quality": None, # None = EFFECT_QUALITY_DEFAULT
+            "seq": 0 # Last journal record contained in this state
         }
 
+    def _apply_record(self, state, record):
+        """Apply one journal record to a state dict (used live and on replay)"""
+        op = record.get("op")
+        if op == "draw":
+            state["history"].append(record["n"])
+            state["current_number"] = record["n"]
+            state["timestamp"] = record.get("t", state["timestamp"])
+        elif op == "reset":
+            state["history"] = []
+            state["current_number"] = None
+            state["timestamp"] = record.get("t", state["timestamp"])
+        elif op == "set":
+            state.update(record["values"])
+            if "history" in record["values"]:
+                # Own list: later draws must not show up in the record
+                state["history"] = list(record["values"]["history"])
+        state["seq"] = record.get("seq", state["seq"])
+
+    # --- Mutations ---
+    def record_draw(self, number):
+        """Persist one drawn number (constant-size write)."""
+        self._record({"op": "draw", "n": number, "t": time.time()})
+
+    def record_reset(self):
+        """Persist a game reset. Keeps settings."""
+        self._record({"op": "reset", "t": time.time()})
+
     def save(self, history, current_number):
-        """Save game state. Preserves other settings."""
-        # Load existing to preserve settings
-        try:
-            state = self._load_from_file(DATA_FILE)
-        except:
-            state = self._get_default_state()
-            
-        state["history"] = history
-        state["current_number"] = current_number
-        state["timestamp"] = time.time()
-        
-        self._write_to_file(state)
+        """Replace the whole game state. Preserves other settings."""
+        self._record({"op": "set", "values": {
+            "history": list(history), # Snapshot, caller keeps appending
+            "current_number": current_number,
+            "timestamp": time.time()
+        }})
 
     def save_volume(self, bgm_vol, se_vol):
-        """Save volume settings. Preserves game state."""
-        try:
-            state = self._load_from_file(DATA_FILE)
-        except:
-            state = self._get_default_state()
-            
-        state["volume_bgm"] = bgm_vol
-        state["volume_se"] = se_vol
-        
+        """Persist volume settings. Preserves game state."""
+        self._record({"op": "set", "values": {
+            "volume_bgm": bgm_vol,
+            "volume_se": se_vol
+        }})
+
+    def save_setting(self, key, value):
+        """Persist a single setting (e.g. "effect_quality"). Preserves game state."""
+        self._record({"op": "set", "values": {key: value}})
+
+    def _record(self, record):
+        with self._lock:
+            # Saving before load(): start from what is on disk
+            self._ensure_loaded()
+            record["seq"] = self._state["seq"] + 1
+            self._apply_record(self._state, record)
+            # Serialize now: the writer runs later, after further mutations
+            line = json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+        self._queue.put(line)
+
+    def flush(self):
+        """Block until every queued record is on disk. Call on shutdown."""
+        self._queue.join()
+
+    def _writer_loop(self):
+        while True:
+            records = [self._queue.get()]
+
+            # Coalesce everything queued meanwhile into one append + fsync
+            while True:
+                try:
+                    records.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._append_journal(records)
+                self._journal_records += len(records)
+
+                if self._journal_records >= JOURNAL_COMPACT_EVERY:
+                    self._compact()
+            except Exception as e:
+                print(f"Save failed: {e}")
+            finally:
+                for _ in records:
+                    self._queue.task_done()
+
+    def _append_journal(self, records):
+        """:param records: encoded journal lines (see _record)"""
+        lines = b"".join(records)
+        with open(JOURNAL_FILE, 'ab') as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _compact(self):
+        # The cache may already contain records still waiting in the queue.
+        # They get appended after the truncate and are skipped on replay (seq <= snapshot seq).
+        with self._lock:
+            state = self._copy_state()
         self._write_to_file(state)
 
+        with open(JOURNAL_FILE, 'wb') as f:
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_records = 0
+
     def _write_to_file(self, state):
-        # 1. Write to main file
-        with open(DATA_FILE, 'w') as f:
-            json.dump(state, f, indent=2)
+        # 1. Write the new snapshot next to the main file (and an independent
+        #    copy for the backup: the journal is truncated right after this)
+        data = json.dumps(state, indent=2)
+        tmp_path = DATA_FILE + ".tmp"
+        self._write_synced(tmp_path, data)
+        if BACKUP_GENERATIONS > 0:
+            self._write_synced(BACKUP_FILE + ".tmp", data)
+
+        # 2. Rotate older backups: bak.N-1 -> bak.N, ..., bak -> bak.2,
+        #    then the copy of the new snapshot becomes bak
+        if BACKUP_GENERATIONS > 0:
+            for gen in range(BACKUP_GENERATIONS, 1, -1):
+                older = self._backup_path(gen - 1)
+                if os.path.exists(older):
+                    os.replace(older, self._backup_path(gen))
+            os.replace(BACKUP_FILE + ".tmp", BACKUP_FILE)
+
+        # 3. Atomically publish the new snapshot and persist the renames
+        os.replace(tmp_path, DATA_FILE)
+        self._fsync_dir(os.path.dirname(DATA_FILE))
+
+    def _write_synced(self, path, data):
+        with open(path, 'w') as f:
+            f.write(data)
             f.flush()
             os.fsync(f.fileno())
 
-        # 2. Verify (optional/simple check)
-        # 3. Update backup
+    def _fsync_dir(self, path):
+        # Directory fsync is not supported on Windows; the rename is still atomic there
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
         try:
-            shutil.copy2(DATA_FILE, BACKUP_FILE)
-        except: pass
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
@@ -0,0 +1,79 @@
+from array import array
+
+
+class DrawPool:
+    """
+    Not-yet-drawn numbers of a range with O(1) remove / contains / random pick.
+    Numbers live in a dense array; removing one swaps the last element into its slot.
+    A position table (indexed by number) remembers where each number currently sits.
+    Behaves as a sequence, so random.choice(pool) works directly.
+    """
+    def __init__(self, numbers):
+        """
+        :param numbers: range of numbers in the pool (any step)
+        """
+        self._numbers = numbers
+        self.reset()
+
+    def reset(self):
+        """Refill with every number of the range"""
+        self._items = array('l', self._numbers)
+        self._pos = array('l', range(len(self._numbers)))
+
+    def _slot(self, num):
+        return (num - self._numbers.start) // self._numbers.step
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, num):
+        if num not in self._numbers: return False
+        return self._pos[self._slot(num)] != -1
+
+    def discard(self, num):
+        """Remove num if present. Returns True if it was removed."""
+        if num not in self._numbers: return False
+        slot = self._slot(num)
+        idx = self._pos[slot]
+        if idx == -1: return False
+
+        # Swap-remove: move last item into the hole
+        last = self._items[-1]
+        self._items[idx] = last
+        self._pos[self._slot(last)] = idx
+        self._items.pop()
+        self._pos[slot] = -1
+        return True
+
+
+class PoolUnion:
+    """
+    Read-only sequence view over several DrawPools (no copying).
+    Indexing walks the pools, so cost depends on the number of pools,
+    not on the number of candidates.
+    """
+    def __init__(self, pools):
+        self._pools = [p for p in pools if len(p)]
+        self._len = sum(len(p) for p in self._pools)
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if index < 0: index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("PoolUnion index out of range")
+        for pool in self._pools:
+            if index < len(pool):
+                return pool[index]
+            index -= len(pool)
+
+    def __iter__(self):
+        for pool in self._pools:
+            yield from pool
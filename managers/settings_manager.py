@@ -0,0 +1,53 @@
+from config import VOLUME_SAVE_DELAY_MS
+
+class VolumeSettings:
+    """
+    Current BGM/SE volume.
+    Changes are applied to the AudioManager immediately, but only persisted
+    after the slider has been idle for VOLUME_SAVE_DELAY_MS (trailing debounce),
+    so one drag costs one disk write. Call flush() on window close.
+    """
+    def __init__(self, data_manager, audio_manager, scheduler, bgm=1.0, se=1.0):
+        """
+        :param scheduler: Tk widget (provides after / after_cancel)
+        """
+        self.dm = data_manager
+        self.audio = audio_manager
+        self.scheduler = scheduler
+        
+        self.bgm = bgm
+        self.se = se
+        self._dirty = False
+        self._save_id = None
+        
+        # Apply initial values without saving
+        self.audio.set_bgm_volume(bgm)
+        self.audio.set_se_volume(se)
+
+    def set_bgm(self, val):
+        self.bgm = val
+        self.audio.set_bgm_volume(val)
+        self._schedule_save()
+
+    def set_se(self, val):
+        self.se = val
+        self.audio.set_se_volume(val)
+        self._schedule_save()
+
+    def _schedule_save(self):
+        self._dirty = True
+        if self._save_id is not None:
+            self.scheduler.after_cancel(self._save_id)
+        self._save_id = self.scheduler.after(VOLUME_SAVE_DELAY_MS, self.flush)
+
+    def flush(self):
+        """Persist pending changes now (if any)"""
+        if self._save_id is not None:
+            try:
+                self.scheduler.after_cancel(self._save_id)
+            except Exception: pass # Already fired
+            self._save_id = None
+            
+        if self._dirty:
+            self._dirty = False
+            self.dm.save_volume(self.bgm, self.se)